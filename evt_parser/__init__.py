@@ -46,6 +46,7 @@ from .converter import (
     BatchConversionSummary,
     convert_evt_to_evtx,
     batch_convert,
+    abatch_convert,
 )
 
 from .exceptions import (
@@ -66,6 +67,7 @@ from .parser import (
     ParseResult,
     parse_evt_file,
     iter_evt_records,
+    iter_evt_record_batches,
 )
 
 from .formatters import (
@@ -83,6 +85,7 @@ from .utils import (
     validate_evt_file,
     generate_output_path,
     find_evt_files,
+    find_evt_files_with_size,
     is_evt_dirty,
     repair_dirty_evt,
 )
@@ -95,12 +98,14 @@ __all__ = [
     # Main conversion functions
     "convert_evt_to_evtx",
     "batch_convert",
+    "abatch_convert",
     # Native EVT parser
     "EvtHeader",
     "EventRecord",
     "ParseResult",
     "parse_evt_file",
     "iter_evt_records",
+    "iter_evt_record_batches",
     # Output formatters
     "Formatter",
     "JsonFormatter",
@@ -128,6 +133,7 @@ __all__ = [
     "validate_evt_file",
     "generate_output_path",
     "find_evt_files",
+    "find_evt_files_with_size",
     "is_evt_dirty",
     "repair_dirty_evt",
     # Metadata
@@ -6,14 +6,24 @@ This module provides a user-friendly CLI tool for:
 """
 
 import argparse
+import itertools
+import os
 import sys
 import logging
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Tuple
 
-from .converter import convert_evt_to_evtx, batch_convert, ConversionStatus
+from .converter import (
+    convert_evt_to_evtx,
+    batch_convert,
+    ConversionStatus,
+    MANIFEST_FILENAME,
+)
 from .parser import parse_evt_file
-from .formatters import get_formatter
+from .formatters import FORMATS, Formatter, get_formatter
 from .exceptions import (
     EvtConverterError,
     PlatformNotSupportedError,
@@ -30,6 +40,14 @@ SYMBOL_SUCCESS = "[+]"
 SYMBOL_FAILURE = "[X]"
 SYMBOL_SKIPPED = "[-]"
 
+# Buffer size for formatted output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# ProcessPoolExecutor rejects more workers than this on Windows
+WINDOWS_MAX_PARSE_WORKERS = 61
+
+logger = logging.getLogger(__name__)
+
 
 def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     """Configure logging based on verbosity level.
@@ -50,28 +68,100 @@ def setup_logging(verbose: bool = False, quiet: bool = False) -> None:
     )
 
 
-def progress_bar(current: int, total: int, file_path: Path, width: int = 40) -> None:
-    """Display a simple progress bar for batch operations.
+class ProgressBar:
+    """Single-line progress bar for batch operations.
 
-    Args:
-        current: Current file number (1-indexed).
-        total: Total number of files.
-        file_path: Path of the current file being processed.
-        width: Width of the progress bar in characters.
+    Redraws are throttled to at most one every ``min_interval`` seconds so that
+    large batches of fast files do not spend their time writing to the terminal.
+    The final update (``current == total``) is always drawn.
     """
-    percent = (current / total) * 100 if total > 0 else 0
-    filled = int(width * current / total) if total > 0 else 0
-    bar = "=" * filled + "-" * (width - filled)
 
-    # Print progress on same line using carriage return
-    sys.stderr.write(f"\r[{bar}] {percent:.1f}% ({current}/{total}) {file_path.name}")
-    sys.stderr.flush()
+    def __init__(self, width: int = 40, min_interval: float = 1 / 30) -> None:
+        """Initialize the progress bar.
+
+        Args:
+            width: Width of the progress bar in characters.
+            min_interval: Minimum number of seconds between two redraws.
+        """
+        self.width = width
+        self.min_interval = min_interval
+        self._last_emit: Optional[float] = None
+
+    def update(self, current: int, total: int, file_path: Path) -> None:
+        """Display the progress bar for the current file.
+
+        Args:
+            current: Current file number (1-indexed).
+            total: Total number of files.
+            file_path: Path of the current file being processed.
+        """
+        now = time.monotonic()
+        if (
+            current != total
+            and self._last_emit is not None
+            and now - self._last_emit < self.min_interval
+        ):
+            return
+        self._last_emit = now
+
+        # Integer math only: percent in tenths, rounded half up
+        if total > 0:
+            filled = (current * self.width) // total
+            tenths = (current * 1000 + total // 2) // total
+        else:
+            filled = tenths = 0
+        bar = "=" * filled + "-" * (self.width - filled)
+        percent = f"{tenths // 10}.{tenths % 10}"
 
-    # Print newline when complete
-    if current == total:
-        sys.stderr.write("\n")
+        # Print progress on same line using carriage return
+        sys.stderr.write(f"\r[{bar}] {percent}% ({current}/{total}) {file_path.name}")
         sys.stderr.flush()
 
+        # Print newline when complete
+        if current == total:
+            sys.stderr.write("\n")
+            sys.stderr.flush()
+
+
+@lru_cache(maxsize=None)
+def _cached_formatter(format_name: str) -> Formatter:
+    """Return the formatter shared by every file a batch worker handles."""
+    return get_formatter(format_name)
+
+
+def _parse_and_write(
+    evt_file: Path, out_file: Path, format_name: str, include_metadata: bool
+) -> int:
+    """Parse a single EVT file and write the formatted output.
+
+    Runs inside the batch-parse worker processes, so it must stay a
+    module-level function (picklable) and only take picklable arguments.
+
+    Args:
+        evt_file: Path to the input .evt file.
+        out_file: Path of the output file to write.
+        format_name: Output format (json, xml, csv).
+        include_metadata: Whether to include file metadata in output.
+
+    Returns:
+        Number of valid records written. 0 means the file had no valid records
+        and no output file was written.
+    """
+    result = parse_evt_file(evt_file)
+    if result.valid_records == 0:
+        return 0
+
+    formatter = _cached_formatter(format_name)
+    with open(
+        out_file,
+        "w",
+        encoding="utf-8",
+        newline=formatter.newline,
+        buffering=OUTPUT_BUFFER_SIZE,
+    ) as fp:
+        formatter.format_to(result, fp, include_metadata=include_metadata)
+    return result.valid_records
+
 
 def convert_single(
     input_file: str,
@@ -93,8 +183,6 @@ def convert_single(
     Returns:
         Exit code: 0 for success, 1 for failure.
     """
-    logger = logging.getLogger(__name__)
-
     try:
         logger.info(f"Converting {input_file}...")
 
@@ -163,6 +251,7 @@ def convert_batch(
     verbose: bool,
     quiet: bool,
     auto_repair: bool = True,
+    jobs: Optional[int] = None,
 ) -> int:
     """Handle batch conversion of multiple files.
 
@@ -175,19 +264,20 @@ def convert_batch(
         stop_on_error: Whether to stop on first error.
         verbose: Whether to show verbose output.
         quiet: Whether to suppress progress output.
+        auto_repair: Whether to repair dirty EVT files before conversion.
+        jobs: Number of wevtutil conversions to run concurrently (default: CPU
+              count, capped at 8).
 
     Returns:
         Exit code: 0 for complete success, 1 for complete failure, 2 for partial success.
     """
-    logger = logging.getLogger(__name__)
-
     try:
-        logger.info(f"Starting batch conversion from {batch_dir}")
+        logger.info("Starting batch conversion from %s", batch_dir)
         if recursive:
             logger.info("Recursive mode enabled")
 
         # Create progress callback unless in quiet mode
-        progress_callback = None if quiet else progress_bar
+        progress_callback = None if quiet else ProgressBar().update
 
         summary = batch_convert(
             source_dir=batch_dir,
@@ -198,6 +288,11 @@ def convert_batch(
             continue_on_error=not stop_on_error,
             progress_callback=progress_callback,
             auto_repair=auto_repair,
+            max_workers=jobs,
+            # Only kept with -O, so the input tree is never written to
+            manifest_file=Path(output_dir) / MANIFEST_FILENAME if output_dir else None,
+            # Per-file results are only listed in verbose mode
+            collect_results=verbose,
         )
 
         # Print summary
@@ -254,11 +349,11 @@ def convert_batch(
         return 1
     except FileValidationError as e:
         print(f"{SYMBOL_FAILURE} Error: {e}", file=sys.stderr)
-        logger.error(f"Directory validation failed: {e}")
+        logger.error("Directory validation failed: %s", e)
         return 1
     except EvtConverterError as e:
         print(f"{SYMBOL_FAILURE} Error: {e}", file=sys.stderr)
-        logger.error(f"Batch conversion error: {e}")
+        logger.error("Batch conversion error: %s", e)
         return 1
     except Exception as e:
         print(f"{SYMBOL_FAILURE} Unexpected error: {e}", file=sys.stderr)
@@ -285,8 +380,6 @@ def parse_single(
     Returns:
         Exit code: 0 for success, 1 for failure.
     """
-    logger = logging.getLogger(__name__)
-
     try:
         input_path = Path(input_file)
         logger.info(f"Parsing {input_file}...")
@@ -301,19 +394,25 @@ def parse_single(
             )
             return 1
 
-        # Format output
+        # Format output, streaming it to the destination
         formatter = get_formatter(format_name)
-        output = formatter.format(result, include_metadata=include_metadata)
 
-        # Write output
         if output_file:
             output_path = Path(output_file)
-            output_path.write_text(output, encoding="utf-8")
+            with open(
+                output_path,
+                "w",
+                encoding="utf-8",
+                newline=formatter.newline,
+                buffering=OUTPUT_BUFFER_SIZE,
+            ) as fp:
+                formatter.format_to(result, fp, include_metadata=include_metadata)
             print(
                 f"{SYMBOL_SUCCESS} Parsed {result.valid_records} records to {output_path}"
             )
         else:
-            print(output)
+            formatter.format_to(result, sys.stdout, include_metadata=include_metadata)
+            sys.stdout.write("\n")
 
         if verbose:
             logger.info(f"Total records: {result.total_records}")
@@ -341,6 +440,18 @@ def parse_single(
         return 1
 
 
+def _max_parse_workers() -> Optional[int]:
+    """Return the most parse worker processes the platform allows, if limited."""
+    return WINDOWS_MAX_PARSE_WORKERS if sys.platform == "win32" else None
+
+
+def _default_parse_workers() -> int:
+    """Return the number of CPUs, capped at the platform's worker limit."""
+    workers = os.cpu_count() or 1
+    limit = _max_parse_workers()
+    return workers if limit is None else min(workers, limit)
+
+
 def parse_batch(
     batch_dir: str,
     output_dir: Optional[str],
@@ -349,9 +460,12 @@ def parse_batch(
     include_metadata: bool,
     verbose: bool,
     quiet: bool,
+    jobs: Optional[int] = None,
 ) -> int:
     """Handle batch parsing of multiple EVT files.
 
+    Files are parsed in parallel worker processes, one per CPU core by default.
+
     Args:
         batch_dir: Directory containing .evt files.
         output_dir: Output directory for formatted files.
@@ -360,16 +474,20 @@ def parse_batch(
         include_metadata: Whether to include file metadata.
         verbose: Whether to show verbose output.
         quiet: Whether to suppress progress output.
+        jobs: Number of worker processes (default: CPU count, at most 61 on
+              Windows; 1 disables the pool).
 
     Returns:
         Exit code: 0 for complete success, 1 for failure, 2 for partial success.
     """
-    logger = logging.getLogger(__name__)
-
     try:
-        from .utils import find_evt_files
+        from .utils import (
+            _path_sort_key,
+            iter_evt_files,
+            validate_legacy_evt_signature,
+        )
 
-        logger.info(f"Starting batch parse from {batch_dir}")
+        logger.info("Starting batch parse from %s", batch_dir)
         source_path = Path(batch_dir)
 
         if not source_path.is_dir():
@@ -379,51 +497,109 @@ def parse_batch(
             )
             return 1
 
-        evt_files = list(find_evt_files(source_path, recursive=recursive))
-        total = len(evt_files)
+        # Files are consumed as the directory scan finds them
+        evt_files = iter_evt_files(source_path, recursive=recursive)
+        first_file = next(evt_files, None)
 
-        if total == 0:
+        if first_file is None:
             print(f"{SYMBOL_FAILURE} No .evt files found in {batch_dir}")
             return 1
 
+        evt_files = itertools.chain([first_file], evt_files)
+
         # Create output directory if specified
         out_path = Path(output_dir) if output_dir else None
         if out_path:
             out_path.mkdir(parents=True, exist_ok=True)
 
-        formatter = get_formatter(format_name)
-        ext = format_name.lower()
+        suffix = f".{format_name.lower()}"
+        created_dirs = {out_path}
+
+        def output_path_for(evt_file: Path) -> Path:
+            if out_path is None:
+                return evt_file.with_suffix(suffix)
+            if not recursive:
+                return out_path / (evt_file.stem + suffix)
+            # Preserve directory structure so same-named files don't collide
+            file_output_dir = out_path / evt_file.relative_to(source_path).parent
+            if file_output_dir not in created_dirs:
+                file_output_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(file_output_dir)
+            return file_output_dir / (evt_file.stem + suffix)
 
         successful = 0
         failed = 0
+        progress = ProgressBar()
 
-        for i, evt_file in enumerate(evt_files, 1):
-            if not quiet:
-                progress_bar(i, total, evt_file)
-
-            try:
-                result = parse_evt_file(evt_file)
-
-                if result.valid_records > 0:
-                    output = formatter.format(result, include_metadata=include_metadata)
-
-                    # Determine output file path
-                    if out_path:
-                        out_file = out_path / f"{evt_file.stem}.{ext}"
-                    else:
-                        out_file = evt_file.with_suffix(f".{ext}")
-
-                    out_file.write_text(output, encoding="utf-8")
-                    successful += 1
-                else:
-                    failed += 1
-                    if verbose:
-                        logger.warning(f"No valid records in {evt_file}")
-
-            except Exception as e:
+        def record_outcome(evt_file: Path, valid_records: int) -> None:
+            nonlocal successful, failed
+            if valid_records > 0:
+                successful += 1
+            else:
                 failed += 1
                 if verbose:
-                    logger.error(f"Failed to parse {evt_file}: {e}")
+                    logger.warning("No valid records in %s", evt_file)
+
+        def record_failure(evt_file: Path, error: BaseException) -> None:
+            nonlocal failed
+            failed += 1
+            if verbose:
+                logger.error("Failed to parse %s: %s", evt_file, error)
+
+        workers = jobs or _default_parse_workers()
+
+        if workers <= 1:
+            # Single worker: skip the process pool and its startup cost
+            file_list = sorted(evt_files, key=_path_sort_key)
+            total = len(file_list)
+            for i, evt_file in enumerate(file_list, 1):
+                if not quiet:
+                    progress.update(i, total, evt_file)
+                try:
+                    valid_records = _parse_and_write(
+                        evt_file,
+                        output_path_for(evt_file),
+                        format_name,
+                        include_metadata,
+                    )
+                except Exception as e:
+                    record_failure(evt_file, e)
+                else:
+                    record_outcome(evt_file, valid_records)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # Workers start on the first files while the scan continues.
+                # Files without an EVT signature are rejected here so they
+                # never cost a round trip to a worker process.
+                futures = {}
+                rejected = 0
+                for evt_file in evt_files:
+                    try:
+                        validate_legacy_evt_signature(evt_file)
+                    except FileValidationError as e:
+                        record_failure(evt_file, e)
+                        rejected += 1
+                        continue
+                    future = executor.submit(
+                        _parse_and_write,
+                        evt_file,
+                        output_path_for(evt_file),
+                        format_name,
+                        include_metadata,
+                    )
+                    futures[future] = evt_file
+                total = len(futures) + rejected
+
+                for done, future in enumerate(as_completed(futures), rejected + 1):
+                    evt_file = futures[future]
+                    if not quiet:
+                        progress.update(done, total, evt_file)
+                    try:
+                        valid_records = future.result()
+                    except Exception as e:
+                        record_failure(evt_file, e)
+                    else:
+                        record_outcome(evt_file, valid_records)
 
         # Print summary
         print("\n" + "=" * 60)
@@ -448,14 +624,11 @@ def parse_batch(
         return 1
 
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
-    """Main entry point for the CLI tool.
-
-    Args:
-        argv: Optional argument list to parse instead of sys.argv.
+def _build_parser() -> Tuple[argparse.ArgumentParser, argparse.ArgumentParser]:
+    """Build the argument parser tree for the CLI.
 
     Returns:
-        Exit code: 0 for success, 1 for failure, 2 for partial success.
+        Tuple of (root parser, parse subcommand parser).
     """
     parser = argparse.ArgumentParser(
         prog="evt-parser",
@@ -514,7 +687,7 @@ Examples:
     parse_parser.add_argument(
         "--format",
         "-F",
-        choices=["json", "xml", "csv"],
+        choices=FORMATS,
         default="json",
         help="Output format (default: json)",
     )
@@ -537,6 +710,15 @@ Examples:
         "--no-metadata", action="store_true", help="Exclude file metadata from output"
     )
 
+    parse_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of parallel worker processes in batch mode "
+        "(default: CPU count, at most 61 on Windows)",
+    )
+
     parse_parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
@@ -608,6 +790,15 @@ Examples:
         help="Disable automatic repair of dirty EVT files",
     )
 
+    convert_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        metavar="N",
+        help="Number of concurrent wevtutil conversions in batch mode "
+        "(default: CPU count, capped at 8)",
+    )
+
     convert_parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
@@ -616,6 +807,23 @@ Examples:
         "-q", "--quiet", action="store_true", help="Suppress progress output"
     )
 
+    return parser, parse_parser
+
+
+# Built once at import so repeated main() calls skip the add_argument work
+_PARSER, _PARSE_PARSER = _build_parser()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Main entry point for the CLI tool.
+
+    Args:
+        argv: Optional argument list to parse instead of sys.argv.
+
+    Returns:
+        Exit code: 0 for success, 1 for failure, 2 for partial success.
+    """
+    parser, parse_parser = _PARSER, _PARSE_PARSER
     args = parser.parse_args(argv)
 
     # Setup logging
@@ -645,6 +853,18 @@ Examples:
             print("Error: Use -O/--output-dir with --batch, not -o", file=sys.stderr)
             return 1
 
+        if args.jobs is not None and args.jobs <= 0:
+            print("Error: --jobs must be positive", file=sys.stderr)
+            return 1
+
+        max_workers = _max_parse_workers()
+        if args.jobs is not None and max_workers and args.jobs > max_workers:
+            print(
+                f"Error: --jobs can be at most {max_workers} on this platform",
+                file=sys.stderr,
+            )
+            return 1
+
         if batch_dir:
             return parse_batch(
                 batch_dir=batch_dir,
@@ -654,6 +874,7 @@ Examples:
                 include_metadata=not args.no_metadata,
                 verbose=args.verbose,
                 quiet=args.quiet,
+                jobs=args.jobs,
             )
         else:
             assert isinstance(input_file, str)
@@ -675,6 +896,7 @@ Examples:
     timeout = getattr(args, "timeout", 60)
     stop_on_error = getattr(args, "stop_on_error", False)
     no_auto_repair = getattr(args, "no_auto_repair", False)
+    jobs = getattr(args, "jobs", None)
 
     if batch_dir and input_file:
         print("Error: Cannot specify both input file and --batch", file=sys.stderr)
@@ -705,6 +927,10 @@ Examples:
         print("Error: Timeout must be positive", file=sys.stderr)
         return 1
 
+    if jobs is not None and jobs <= 0:
+        print("Error: --jobs must be positive", file=sys.stderr)
+        return 1
+
     if batch_dir:
         return convert_batch(
             batch_dir=batch_dir,
@@ -716,6 +942,7 @@ Examples:
             verbose=verbose,
             quiet=quiet,
             auto_repair=not no_auto_repair,
+            jobs=jobs,
         )
     else:
         assert isinstance(input_file, str)
@@ -5,23 +5,76 @@ command-line tool to convert Windows XP / Windows Server 2003 legacy Event Log
 (.evt) files to modern Windows Event Log (.evtx) format.
 """
 
+import asyncio
+import atexit
+import contextlib
+import json
+import locale
+import os
+import queue
 import subprocess
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Callable, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from .exceptions import ConversionError, FileValidationError
 from .utils import (
+    DATACLASS_SLOTS,
     check_platform,
     check_wevtutil_available,
-    validate_evt_file,
+    _is_dirty_header,
+    _path_sort_key,
+    _validate_evt_file,
+    _wevtutil_path,
     generate_output_path,
-    find_evt_files,
-    is_evt_dirty,
+    iter_evt_files,
     repair_dirty_evt,
 )
 
+#: File name of the batch manifest written into the output directory.
+MANIFEST_FILENAME = ".evt_manifest.json"
+
+#: Number of completed files between manifest writes during a batch.
+MANIFEST_FLUSH_INTERVAL = 50
+
+#: Number of failures a batch keeps when it isn't collecting every result.
+RECENT_FAILURES_LIMIT = 100
+
+#: Most conversions a batch runs at once by default, whatever the CPU count;
+#: beyond this, concurrent wevtutil runs mostly compete for the disk.
+DEFAULT_MAX_WORKERS_LIMIT = 8
+
+# Fixed parts of the wevtutil command line (see _wevtutil_command())
+_WEVTUTIL = "wevtutil"
+_WEVTUTIL_EXPORT_LOG: Tuple[str, ...] = ("epl",)
+_WEVTUTIL_LOG_FLAGS: Tuple[str, ...] = ("/lf:true",)
+
+# Keep wevtutil from opening a console window when run from a GUI process
+_CREATION_FLAGS = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+
+# Set EVT_PARSER_ASYNC_CLEANUP=1 to delete repaired temp copies on a background
+# thread instead of in each conversion (see _remove_temp_file())
+_ASYNC_CLEANUP = os.environ.get("EVT_PARSER_ASYNC_CLEANUP") == "1"
+_cleanup_queue: "queue.SimpleQueue[Optional[Path]]" = queue.SimpleQueue()
+_cleanup_thread: Optional[threading.Thread] = None
+_cleanup_lock = threading.Lock()
+
 
 class ConversionStatus(Enum):
     """Status of a conversion operation.
@@ -37,7 +90,7 @@ class ConversionStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ConversionResult:
     """Result of a single file conversion operation.
 
@@ -65,7 +118,7 @@ class ConversionResult:
         return self.status == ConversionStatus.SUCCESS
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BatchConversionSummary:
     """Summary of a batch conversion operation.
 
@@ -74,7 +127,9 @@ class BatchConversionSummary:
         successful: Number of successfully converted files.
         failed: Number of files that failed to convert.
         skipped: Number of files that were skipped.
-        results: List of individual ConversionResult objects for each file.
+        results: List of individual ConversionResult objects for each file. For
+                batches run with collect_results=False, only the most recent
+                failures (up to RECENT_FAILURES_LIMIT) are kept.
         total_duration_seconds: Total time taken for all conversions in seconds.
     """
 
@@ -139,146 +194,602 @@ def convert_evt_to_evtx(
         >>>
         >>> result = convert_evt_to_evtx("System.evt", "Output.evtx", overwrite=True)
     """
-    import time
+    # Perform platform and tool checks
+    check_platform()
+    check_wevtutil_available()
+
+    return _convert_file(input_file, output_file, overwrite, timeout, auto_repair)
+
 
+def _convert_file(
+    input_file: Union[str, Path],
+    output_file: Optional[Union[str, Path]],
+    overwrite: bool,
+    timeout: int,
+    auto_repair: bool,
+    cwd: Optional[str] = None,
+) -> ConversionResult:
+    """Convert one file without repeating the platform and tool checks.
+
+    Used by convert_evt_to_evtx() and by batch_convert(), which checks once for
+    the whole batch instead of once per file and passes the working directory
+    it looked up once (see _wevtutil_command()).
+    """
     # Convert to Path objects
     input_path = Path(input_file)
     output_path = Path(output_file) if output_file else generate_output_path(input_path)
 
-    # Perform platform and tool checks
-    check_platform()
-    check_wevtutil_available()
+    prepared = _prepare_conversion(input_path, output_path, overwrite, auto_repair)
+    if isinstance(prepared, ConversionResult):
+        return prepared
+    effective_input, temp_file = prepared
 
-    # Validate files
+    # Build the wevtutil command
+    command = _wevtutil_command(effective_input, output_path, cwd)
+
+    # Execute the conversion
+    start_time = time.perf_counter_ns()
     try:
-        validate_evt_file(input_path, output_path, overwrite)
-    except Exception as e:
-        # Return a FAILED result if validation fails
+        try:
+            # Only stderr is read (for error messages); stdout is discarded
+            subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+                check=True,
+                creationflags=_CREATION_FLAGS,
+            )
+        finally:
+            # Every outcome below reports this duration
+            duration = _seconds_since(start_time)
+        return _completed_result(input_path, output_path, duration)
+
+    except subprocess.TimeoutExpired:
         return ConversionResult(
             status=ConversionStatus.FAILED,
             input_file=input_path,
             output_file=output_path,
-            error_message=str(e),
+            error_message=f"Conversion timed out after {timeout} seconds",
+            duration_seconds=duration,
         )
 
-    # Check if output exists and we're not overwriting - skip this file
-    if output_path.exists() and not overwrite:
+    except subprocess.CalledProcessError as e:
+        error_msg = f"wevtutil failed with return code {e.returncode}"
+        message = _decode_stderr(e.stderr)
+        if message:
+            error_msg += f": {message}"
+
         return ConversionResult(
-            status=ConversionStatus.SKIPPED,
+            status=ConversionStatus.FAILED,
             input_file=input_path,
             output_file=output_path,
-            error_message="Output file exists and overwrite is disabled",
+            error_message=error_msg,
+            duration_seconds=duration,
         )
 
-    # Check for and handle dirty EVT files
-    temp_file = None
-    effective_input = input_path
+    except Exception as e:
+        return ConversionResult(
+            status=ConversionStatus.FAILED,
+            input_file=input_path,
+            output_file=output_path,
+            error_message=f"Unexpected error: {str(e)}",
+            duration_seconds=duration,
+        )
 
-    try:
-        is_dirty = is_evt_dirty(input_path)
-    except FileValidationError:
-        is_dirty = False
+    finally:
+        _remove_temp_file(temp_file)
 
-    if is_dirty:
-        try:
-            if auto_repair:
-                temp_file = repair_dirty_evt(input_path)
-                effective_input = temp_file
-            else:
-                return ConversionResult(
-                    status=ConversionStatus.FAILED,
-                    input_file=input_path,
-                    output_file=output_path,
-                    error_message=(
-                        f"EVT file has DIRTY flag set: {input_path}. "
-                        "Enable auto_repair to fix."
-                    ),
-                )
-        except Exception as e:
-            return ConversionResult(
-                status=ConversionStatus.FAILED,
-                input_file=input_path,
-                output_file=output_path,
-                error_message=str(e),
-            )
 
-    # Build the wevtutil command
-    # Format: wevtutil epl source.evt target.evtx /lf:true
-    command = [
-        "wevtutil",
-        "epl",
-        str(effective_input.absolute()),
-        str(output_path.absolute()),
-        "/lf:true",
-    ]
+async def _aconvert_evt_to_evtx(
+    input_path: Path,
+    output_path: Path,
+    overwrite: bool,
+    timeout: int,
+    auto_repair: bool,
+    cwd: Optional[str] = None,
+) -> ConversionResult:
+    """Asynchronous counterpart of convert_evt_to_evtx() used by abatch_convert().
 
-    # Execute the conversion
-    start_time = time.time()
+    Platform and tool checks are left to the caller. File validation and dirty
+    file repair run in the default executor so they don't block the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    prepared = await loop.run_in_executor(
+        None, _prepare_conversion, input_path, output_path, overwrite, auto_repair
+    )
+    if isinstance(prepared, ConversionResult):
+        return prepared
+    effective_input, temp_file = prepared
+
+    command = _wevtutil_command(effective_input, output_path, cwd)
+
+    start_time = time.perf_counter_ns()
     try:
-        subprocess.run(
-            command, capture_output=True, text=True, timeout=timeout, check=True
-        )
-        duration = time.time() - start_time
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+                creationflags=_CREATION_FLAGS,
+            )
+            try:
+                _, stderr = await asyncio.wait_for(
+                    process.communicate(), timeout=timeout
+                )
+            except BaseException:
+                # Timed out or cancelled: don't leave wevtutil running
+                if process.returncode is None:
+                    with contextlib.suppress(ProcessLookupError):
+                        process.kill()
+                    # Reap it so the temp copy is closed before it's removed;
+                    # shielded since this task may already be cancelled
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await asyncio.shield(process.wait())
+                raise
+        finally:
+            # Every outcome below reports this duration
+            duration = _seconds_since(start_time)
+
+        if process.returncode != 0:
+            error_msg = f"wevtutil failed with return code {process.returncode}"
+            message = _decode_stderr(stderr)
+            if message:
+                error_msg += f": {message}"
 
-        # Verify output file was created
-        if not output_path.exists():
             return ConversionResult(
                 status=ConversionStatus.FAILED,
                 input_file=input_path,
                 output_file=output_path,
-                error_message="Output file was not created by wevtutil",
+                error_message=error_msg,
                 duration_seconds=duration,
             )
 
-        # Success!
+        return _completed_result(input_path, output_path, duration)
+
+    except asyncio.TimeoutError:
         return ConversionResult(
-            status=ConversionStatus.SUCCESS,
+            status=ConversionStatus.FAILED,
             input_file=input_path,
             output_file=output_path,
+            error_message=f"Conversion timed out after {timeout} seconds",
             duration_seconds=duration,
         )
 
-    except subprocess.TimeoutExpired:
-        duration = time.time() - start_time
+    except Exception as e:
         return ConversionResult(
             status=ConversionStatus.FAILED,
             input_file=input_path,
             output_file=output_path,
-            error_message=f"Conversion timed out after {timeout} seconds",
+            error_message=f"Unexpected error: {str(e)}",
             duration_seconds=duration,
         )
 
-    except subprocess.CalledProcessError as e:
-        duration = time.time() - start_time
-        error_msg = f"wevtutil failed with return code {e.returncode}"
-        if e.stderr:
-            error_msg += f": {e.stderr.strip()}"
+    finally:
+        _remove_temp_file(temp_file)
+
+
+def _prepare_conversion(
+    input_path: Path, output_path: Path, overwrite: bool, auto_repair: bool
+) -> Union[ConversionResult, Tuple[Path, Optional[Path]]]:
+    """Validate a conversion and repair a dirty input if needed.
+
+    An existing output file is skipped before the input is validated, so
+    resuming a batch costs one stat per finished file.
+
+    Returns:
+        Either a final ConversionResult (validation failed, output exists, or the
+        file is dirty and can't be repaired), or a tuple of the file wevtutil
+        should read and the temporary repaired copy to delete afterwards (None
+        if the original file is used).
+    """
+    # Resuming a batch: skip existing outputs with one stat, before any file reads
+    if not overwrite and output_path.is_file():
+        return _skipped_result(input_path, output_path)
 
+    # Validate files
+    try:
+        output_exists, header = _validate_evt_file(input_path, output_path)
+    except Exception as e:
+        # Return a FAILED result if validation fails
         return ConversionResult(
             status=ConversionStatus.FAILED,
             input_file=input_path,
             output_file=output_path,
-            error_message=error_msg,
-            duration_seconds=duration,
+            error_message=str(e),
         )
 
+    # Check if output exists and we're not overwriting - skip this file
+    if output_exists and not overwrite:
+        return _skipped_result(input_path, output_path)
+
+    # Check for and handle dirty EVT files
+    try:
+        is_dirty = _is_dirty_header(input_path, header)
+    except FileValidationError:
+        is_dirty = False
+
+    if not is_dirty:
+        return input_path, None
+
+    try:
+        if auto_repair:
+            temp_file = repair_dirty_evt(input_path)
+            return temp_file, temp_file
+        return ConversionResult(
+            status=ConversionStatus.FAILED,
+            input_file=input_path,
+            output_file=output_path,
+            error_message=(
+                f"EVT file has DIRTY flag set: {input_path}. "
+                "Enable auto_repair to fix."
+            ),
+        )
     except Exception as e:
-        duration = time.time() - start_time
         return ConversionResult(
             status=ConversionStatus.FAILED,
             input_file=input_path,
             output_file=output_path,
-            error_message=f"Unexpected error: {str(e)}",
+            error_message=str(e),
+        )
+
+
+def _skipped_result(input_path: Path, output_path: Path) -> ConversionResult:
+    """Build the result for an input whose output exists and isn't overwritten."""
+    return ConversionResult(
+        status=ConversionStatus.SKIPPED,
+        input_file=input_path,
+        output_file=output_path,
+        error_message="Output file exists and overwrite is disabled",
+    )
+
+
+def _wevtutil_command(
+    effective_input: Path, output_path: Path, cwd: Optional[str] = None
+) -> Tuple[str, ...]:
+    """Build the wevtutil command line for one conversion.
+
+    wevtutil is run by the full path check_wevtutil_available() found (it is
+    looked up once per process), so starting it searches no directories.
+    Relative paths are resolved against cwd when given, saving the getcwd()
+    call Path.absolute() makes each time.
+    """
+    # Format: wevtutil epl source.evt target.evtx /lf:true
+    return (
+        _wevtutil_path() or _WEVTUTIL,
+        *_WEVTUTIL_EXPORT_LOG,
+        _absolute(effective_input, cwd),
+        _absolute(output_path, cwd),
+        *_WEVTUTIL_LOG_FLAGS,
+    )
+
+
+def _absolute(path: Path, cwd: Optional[str]) -> str:
+    """Return path as an absolute string, joining it onto cwd if one is given."""
+    if path.is_absolute():
+        return str(path)
+    if cwd is None:
+        return str(path.absolute())
+    return os.path.join(cwd, path)
+
+
+def _seconds_since(start_ns: int) -> float:
+    """Seconds elapsed since a time.perf_counter_ns() reading."""
+    return (time.perf_counter_ns() - start_ns) / 1e9
+
+
+def _decode_stderr(stderr: Optional[bytes]) -> str:
+    """Decode wevtutil's stderr the way text-mode pipes would, for messages."""
+    if not stderr:
+        return ""
+    return stderr.decode(locale.getpreferredencoding(False), errors="replace").strip()
+
+
+def _completed_result(
+    input_path: Path, output_path: Path, duration: float
+) -> ConversionResult:
+    """Build the result for a wevtutil run that exited successfully."""
+    # Verify output file was created
+    if not output_path.exists():
+        return ConversionResult(
+            status=ConversionStatus.FAILED,
+            input_file=input_path,
+            output_file=output_path,
+            error_message="Output file was not created by wevtutil",
             duration_seconds=duration,
         )
 
-    finally:
-        # Clean up temporary file
-        if temp_file is not None and temp_file.exists():
+    # Success!
+    return ConversionResult(
+        status=ConversionStatus.SUCCESS,
+        input_file=input_path,
+        output_file=output_path,
+        duration_seconds=duration,
+    )
+
+
+def _remove_temp_file(temp_file: Optional[Path]) -> None:
+    """Delete a temporary repaired copy, ignoring errors.
+
+    With EVT_PARSER_ASYNC_CLEANUP=1 the file is queued for the cleanup thread
+    instead, so conversions don't wait on the unlink.
+    """
+    if temp_file is None:
+        return
+    if _ASYNC_CLEANUP:
+        _start_cleanup_thread()
+        _cleanup_queue.put(temp_file)
+    else:
+        _unlink_quietly(temp_file)
+
+
+def _unlink_quietly(path: Path) -> None:
+    """Delete a file if it exists, ignoring errors."""
+    try:
+        path.unlink()
+    except OSError:
+        pass  # Best effort cleanup
+
+
+def _start_cleanup_thread() -> None:
+    """Start the temp file cleanup thread if it isn't running yet."""
+    global _cleanup_thread
+    if _cleanup_thread is not None:
+        return
+    with _cleanup_lock:
+        if _cleanup_thread is None:
+            thread = threading.Thread(
+                target=_run_cleanup, name="evt-parser-cleanup", daemon=True
+            )
+            thread.start()
+            atexit.register(_drain_cleanup_queue)
+            _cleanup_thread = thread
+
+
+def _run_cleanup() -> None:
+    """Delete queued temp files until a None sentinel arrives."""
+    while True:
+        path = _cleanup_queue.get()
+        if path is None:
+            return
+        _unlink_quietly(path)
+
+
+def _drain_cleanup_queue() -> None:
+    """Stop the cleanup thread once it has deleted every queued file."""
+    global _cleanup_thread
+    with _cleanup_lock:
+        thread, _cleanup_thread = _cleanup_thread, None
+        if thread is not None:
+            _cleanup_queue.put(None)
+            thread.join()
+            atexit.unregister(_drain_cleanup_queue)
+
+
+def _load_manifest(manifest_file: Path) -> Dict[str, Dict[str, Any]]:
+    """Load a batch manifest, returning an empty one if it is missing or unreadable."""
+    try:
+        with manifest_file.open("r", encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return entries if isinstance(entries, dict) else {}
+
+
+def _save_manifest(manifest_file: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Write a batch manifest atomically so an interrupted run can't corrupt it."""
+    temp_file = manifest_file.with_name(manifest_file.name + ".tmp")
+    try:
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        with temp_file.open("w", encoding="utf-8") as f:
+            json.dump(entries, f, indent=2, sort_keys=True)
+        os.replace(temp_file, manifest_file)
+    except OSError:
+        pass  # The manifest is only an optimization for later runs
+
+
+def _manifest_stamp(evt_file: Path) -> Dict[str, int]:
+    """Identify the current contents of an input file for the manifest."""
+    stat = evt_file.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _default_max_workers() -> int:
+    """Return the number of CPUs, capped at DEFAULT_MAX_WORKERS_LIMIT."""
+    return min(os.cpu_count() or 1, DEFAULT_MAX_WORKERS_LIMIT)
+
+
+class _BatchRun:
+    """Bookkeeping shared by batch_convert() and abatch_convert().
+
+    Discovers the input files, works out their output paths, and collects
+    results, counters and manifest updates as conversions finish.
+    """
+
+    def __init__(
+        self,
+        source_dir: Union[str, Path],
+        output_dir: Optional[Union[str, Path]],
+        recursive: bool,
+        overwrite: bool,
+        manifest_file: Optional[Union[str, Path]],
+        collect_results: bool = True,
+    ) -> None:
+        # Convert to Path objects
+        self.source_path = Path(source_dir)
+        self.output_path = Path(output_dir) if output_dir else None
+        self.recursive = recursive
+        self.overwrite = overwrite
+        # Resolves relative paths for every wevtutil command in the batch
+        self.cwd = os.getcwd()
+
+        # Validates the directory now; files are found as discover() runs
+        self._found = iter_evt_files(self.source_path, recursive=recursive)
+        self._created_dirs: Set[Path] = set()
+
+        # Files, output paths and results, in discovery order
+        self.evt_files: List[Path] = []
+        self.output_files: List[Optional[Path]] = []
+        self.results: List[Optional[ConversionResult]] = []
+        self.collect_results = collect_results
+        self.recent_failures: "deque[ConversionResult]" = deque(
+            maxlen=RECENT_FAILURES_LIMIT
+        )
+        self.counts: Dict[ConversionStatus, int] = dict.fromkeys(ConversionStatus, 0)
+
+        self.manifest_path = Path(manifest_file) if manifest_file else None
+        self.manifest = _load_manifest(self.manifest_path) if self.manifest_path else {}
+        self._manifest_pending = 0
+
+    @property
+    def total(self) -> int:
+        """Number of files discovered so far."""
+        return len(self.evt_files)
+
+    def discover(self) -> Iterator[int]:
+        """Yield the index of each .evt file as the directory scan finds it.
+
+        Output directories are created the first time a file needs them.
+        """
+        for evt_file in self._found:
+            self.evt_files.append(evt_file)
+            self.output_files.append(self._output_file_for(evt_file))
+            if self.collect_results:
+                self.results.append(None)
+            yield len(self.evt_files) - 1
+
+    def sorted_indices(self, indices: Iterable[int]) -> List[int]:
+        """Return file indices in sorted input path order."""
+        evt_files = self.evt_files
+        return sorted(indices, key=lambda index: _path_sort_key(evt_files[index]))
+
+    def _output_file_for(self, evt_file: Path) -> Optional[Path]:
+        if self.output_path is None:
+            # Output to same directory as input
+            return None
+        if self.recursive:
+            # Preserve directory structure relative to source_dir
+            relative_dir = evt_file.relative_to(self.source_path).parent
+            file_output_dir = self.output_path / relative_dir
+        else:
+            # All files go to output_dir root
+            file_output_dir = self.output_path
+        if file_output_dir not in self._created_dirs:
+            file_output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(file_output_dir)
+        return generate_output_path(evt_file, file_output_dir)
+
+    def target_for(self, index: int) -> Path:
+        """Return the path this run writes the file at index to."""
+        return self.output_files[index] or generate_output_path(self.evt_files[index])
+
+    def _manifest_entry(self, index: int) -> Optional[Dict[str, Any]]:
+        # A recorded success only counts for the output this run would write
+        if self.manifest_path is None or self.overwrite:
+            return None
+        entry = self.manifest.get(str(self.evt_files[index].absolute()))
+        if not entry or entry.get("status") != ConversionStatus.SUCCESS.value:
+            return None
+        target = _absolute(self.target_for(index), self.cwd)
+        if entry.get("output_file") != target:
+            return None
+        return entry
+
+    def _is_unchanged(self, index: int, entry: Dict[str, Any]) -> bool:
+        try:
+            stamp = _manifest_stamp(self.evt_files[index])
+        except OSError:
+            return False
+        return all(entry.get(name) == value for name, value in stamp.items())
+
+    def already_converted(self, index: int) -> Optional[ConversionResult]:
+        """Return a SKIPPED result if the manifest shows the file is up to date."""
+        entry = self._manifest_entry(index)
+        if entry is None or not self._is_unchanged(index, entry):
+            return None
+        converted = self.target_for(index)
+        if not converted.is_file():
+            return None
+        return ConversionResult(
+            status=ConversionStatus.SKIPPED,
+            input_file=self.evt_files[index],
+            output_file=converted,
+            error_message="Already converted and unchanged since the last run",
+        )
+
+    def overwrite_for(self, index: int) -> bool:
+        """Return whether the output of the file at index may be replaced.
+
+        An input that changed since the manifest recorded its conversion is
+        converted again, replacing the stale output.
+        """
+        if self.overwrite:
+            return True
+        entry = self._manifest_entry(index)
+        return entry is not None and not self._is_unchanged(index, entry)
+
+    def record(self, index: int, result: ConversionResult) -> None:
+        """Store the result for the file at index and update the counters."""
+        # Update counters
+        self.counts[result.status] += 1
+        if self.collect_results:
+            self.results[index] = result
+        elif result.status is ConversionStatus.FAILED:
+            self.recent_failures.append(result)
+        self._update_manifest(index, result)
+
+    def _update_manifest(self, index: int, result: ConversionResult) -> None:
+        key = str(result.input_file.absolute())
+        if result.status is ConversionStatus.SUCCESS:
             try:
-                temp_file.unlink()
+                entry: Dict[str, Any] = _manifest_stamp(result.input_file)
             except OSError:
-                pass  # Best effort cleanup
+                return
+            entry["status"] = result.status.value
+            entry["output_file"] = _absolute(self.target_for(index), self.cwd)
+            self.manifest[key] = entry
+        elif result.status is ConversionStatus.FAILED:
+            if self.manifest.pop(key, None) is None:
+                return
+        else:
+            return
+
+        self._manifest_pending += 1
+        if self._manifest_pending >= MANIFEST_FLUSH_INTERVAL:
+            self.flush_manifest()
+
+    def flush_manifest(self) -> None:
+        """Write pending manifest changes to disk."""
+        if self.manifest_path and self._manifest_pending:
+            _save_manifest(self.manifest_path, self.manifest)
+            self._manifest_pending = 0
+
+    def summary(self, total_duration: float) -> BatchConversionSummary:
+        """Build the summary of the files recorded so far.
+
+        Results are listed in sorted input path order, whatever order the files
+        were discovered or finished in. Without collect_results, only the
+        recent failures are listed, in the order they finished.
+        """
+        if self.collect_results:
+            order = self.sorted_indices(range(self.total))
+            results = [
+                result
+                for result in map(self.results.__getitem__, order)
+                if result is not None
+            ]
+        else:
+            results = list(self.recent_failures)
+        return BatchConversionSummary(
+            total=self.total,
+            successful=self.counts[ConversionStatus.SUCCESS],
+            failed=self.counts[ConversionStatus.FAILED],
+            skipped=self.counts[ConversionStatus.SKIPPED],
+            results=results,
+            total_duration_seconds=total_duration,
+        )
 
 
 def batch_convert(
@@ -290,6 +801,9 @@ def batch_convert(
     continue_on_error: bool = True,
     progress_callback: Optional[Callable[[int, int, Path], None]] = None,
     auto_repair: bool = True,
+    max_workers: Optional[int] = None,
+    manifest_file: Optional[Union[str, Path]] = None,
+    collect_results: bool = True,
 ) -> BatchConversionSummary:
     """Convert multiple .evt files in a directory to .evtx format.
 
@@ -313,6 +827,28 @@ def batch_convert(
                           where current is the number of files processed so far,
                           total is the total number of files to process,
                           and file is the current file being processed.
+        auto_repair: If True (default), automatically repair dirty EVT files
+                    before conversion (see convert_evt_to_evtx).
+        max_workers: Number of conversions to run concurrently (default: the
+                    number of CPUs, at most DEFAULT_MAX_WORKERS_LIMIT). Each
+                    conversion is a separate wevtutil process, so worker
+                    threads only wait on it. With more than one worker,
+                    conversions start while the directory is still being
+                    scanned, and the progress callback is called from the
+                    calling thread as files complete rather than before each
+                    starts.
+        manifest_file: Optional path of a JSON manifest recording which inputs
+                      were converted successfully, keyed by path, size and
+                      modification time. Unless overwrite is True, inputs that
+                      are unchanged since a recorded success to the same output
+                      path (and whose output still exists) are skipped without
+                      re-validating them, and inputs that changed since then
+                      are converted again over their old output.
+        collect_results: If True (default), the summary lists the result of
+                        every file. If False, only the counts and the most
+                        recent failures (up to RECENT_FAILURES_LIMIT) are
+                        kept, so memory doesn't grow with the number of
+                        files converted.
 
     Returns:
         BatchConversionSummary object with statistics and individual results.
@@ -332,86 +868,207 @@ def batch_convert(
         ...     print(f"[{current}/{total}] Processing {file.name}")
         >>> summary = batch_convert("C:/Logs", progress_callback=progress)
     """
-    import time
-
-    # Convert to Path objects
-    source_path = Path(source_dir)
-    output_path = Path(output_dir) if output_dir else None
-
     # Perform platform and tool checks
     check_platform()
     check_wevtutil_available()
 
-    # Find all .evt files
-    evt_files = find_evt_files(source_path, recursive=recursive)
+    batch = _BatchRun(
+        source_dir, output_dir, recursive, overwrite, manifest_file, collect_results
+    )
+    evt_files = batch.evt_files
 
-    # Initialize counters and results
-    results: List[ConversionResult] = []
-    successful = 0
-    failed = 0
-    skipped = 0
-    total = len(evt_files)
+    if max_workers is None:
+        max_workers = _default_max_workers()
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
 
-    # Process each file
-    for index, evt_file in enumerate(evt_files, start=1):
-        # Call progress callback if provided
-        if progress_callback:
-            progress_callback(index, total, evt_file)
-
-        # Determine output file path
-        if output_path:
-            # Preserve directory structure in output
-            if recursive:
-                # Calculate relative path from source_dir
-                relative_path = evt_file.relative_to(source_path)
-                file_output_dir = output_path / relative_path.parent
-                # Create output subdirectory if needed
-                file_output_dir.mkdir(parents=True, exist_ok=True)
-                file_output_path = generate_output_path(evt_file, file_output_dir)
-            else:
-                # All files go to output_dir root
-                output_path.mkdir(parents=True, exist_ok=True)
-                file_output_path = generate_output_path(evt_file, output_path)
-        else:
-            # Output to same directory as input
-            file_output_path = None
-
-        # Convert the file
-        result = convert_evt_to_evtx(
-            evt_file,
-            file_output_path,
-            overwrite=overwrite,
-            timeout=timeout,
-            auto_repair=auto_repair,
-        )
+    try:
+        if max_workers <= 1:
+            # The callback runs before each file, so the total is needed first;
+            # files are then processed in sorted path order
+            indices = batch.sorted_indices(batch.discover())
+            total = batch.total
 
-        # Update counters
-        if result.status == ConversionStatus.SUCCESS:
-            successful += 1
-        elif result.status == ConversionStatus.FAILED:
-            failed += 1
-            # Stop on first error if continue_on_error is False
-            if not continue_on_error:
-                raise ConversionError(
-                    f"Conversion failed for {evt_file}: {result.error_message}"
+            # Process each file
+            for current, index in enumerate(indices, start=1):
+                evt_file = evt_files[index]
+
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(current, total, evt_file)
+
+                # Convert the file unless a previous run already did
+                result = batch.already_converted(index) or _convert_file(
+                    evt_file,
+                    batch.output_files[index],
+                    batch.overwrite_for(index),
+                    timeout,
+                    auto_repair,
+                    batch.cwd,
                 )
-        elif result.status == ConversionStatus.SKIPPED:
-            skipped += 1
+                batch.record(index, result)
+
+                # Stop on first error if continue_on_error is False
+                if result.status is ConversionStatus.FAILED and not continue_on_error:
+                    raise ConversionError(
+                        f"Conversion failed for {evt_file}: {result.error_message}"
+                    )
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Conversions start while the directory scan is still running
+                futures: Dict[Future[ConversionResult], int] = {}
+                unchanged: List[int] = []
+                for index in batch.discover():
+                    previous = batch.already_converted(index)
+                    if previous is not None:
+                        batch.record(index, previous)
+                        unchanged.append(index)
+                        continue
+                    future = executor.submit(
+                        _convert_file,
+                        evt_files[index],
+                        batch.output_files[index],
+                        batch.overwrite_for(index),
+                        timeout,
+                        auto_repair,
+                        batch.cwd,
+                    )
+                    futures[future] = index
+
+                # Discovery is done, so progress can be reported against a total
+                total = batch.total
+                if progress_callback:
+                    for done, index in enumerate(unchanged, start=1):
+                        progress_callback(done, total, evt_files[index])
 
-        results.append(result)
+                completed = as_completed(futures)
+                for done, future in enumerate(completed, start=len(unchanged) + 1):
+                    index = futures[future]
+                    evt_file = evt_files[index]
+                    result = future.result()
+                    batch.record(index, result)
 
-    total_duration = time.time() - start_time
+                    if progress_callback:
+                        progress_callback(done, total, evt_file)
+
+                    # Stop on first error if continue_on_error is False
+                    if (
+                        result.status is ConversionStatus.FAILED
+                        and not continue_on_error
+                    ):
+                        for pending in futures:
+                            pending.cancel()
+                        raise ConversionError(
+                            f"Conversion failed for {evt_file}: {result.error_message}"
+                        )
+    finally:
+        batch.flush_manifest()
 
     # Create summary
-    summary = BatchConversionSummary(
-        total=total,
-        successful=successful,
-        failed=failed,
-        skipped=skipped,
-        results=results,
-        total_duration_seconds=total_duration,
+    return batch.summary(_seconds_since(start_time))
+
+
+async def abatch_convert(
+    source_dir: Union[str, Path],
+    output_dir: Optional[Union[str, Path]] = None,
+    recursive: bool = False,
+    overwrite: bool = False,
+    timeout: int = 60,
+    continue_on_error: bool = True,
+    progress_callback: Optional[Callable[[int, int, Path], None]] = None,
+    auto_repair: bool = True,
+    max_workers: Optional[int] = None,
+    manifest_file: Optional[Union[str, Path]] = None,
+    collect_results: bool = True,
+) -> BatchConversionSummary:
+    """Convert multiple .evt files to .evtx format from an asyncio event loop.
+
+    Takes the same arguments as batch_convert() and returns the same summary,
+    with results in the same (sorted input) order. Instead of a thread per
+    conversion, wevtutil processes are started with asyncio subprocesses and
+    their exits are reaped by the event loop; at most max_workers (default as
+    for batch_convert()) run at a time. The progress callback is called on the
+    event loop as files complete.
+
+    Raises:
+        PlatformNotSupportedError: If not running on Windows.
+        WevtutilNotFoundError: If wevtutil is not available.
+        FileValidationError: If the source directory doesn't exist or is invalid.
+        ConversionError: If continue_on_error is False and a conversion fails.
+
+    Example:
+        >>> summary = asyncio.run(abatch_convert("C:/Logs", max_workers=8))
+        >>> print(f"Converted {summary.successful}/{summary.total} files")
+    """
+    # Perform platform and tool checks
+    check_platform()
+    check_wevtutil_available()
+
+    batch = _BatchRun(
+        source_dir, output_dir, recursive, overwrite, manifest_file, collect_results
     )
+    evt_files = batch.evt_files
+
+    if max_workers is None:
+        max_workers = _default_max_workers()
+    in_flight = asyncio.Semaphore(max_workers)
+
+    async def convert(index: int) -> Tuple[int, ConversionResult]:
+        async with in_flight:
+            evt_file = evt_files[index]
+            result = await _aconvert_evt_to_evtx(
+                evt_file,
+                batch.target_for(index),
+                batch.overwrite_for(index),
+                timeout,
+                auto_repair,
+                batch.cwd,
+            )
+        return index, result
+
+    start_time = time.perf_counter_ns()
+
+    try:
+        tasks: List["asyncio.Future[Tuple[int, ConversionResult]]"] = []
+        unchanged: List[int] = []
+        for index in batch.discover():
+            previous = batch.already_converted(index)
+            if previous is not None:
+                batch.record(index, previous)
+                unchanged.append(index)
+                continue
+            tasks.append(asyncio.ensure_future(convert(index)))
+            # Let the new task start its conversion while the scan continues
+            await asyncio.sleep(0)
 
-    return summary
+        # Discovery is done, so progress can be reported against a total
+        total = batch.total
+        if progress_callback:
+            for done, index in enumerate(unchanged, start=1):
+                progress_callback(done, total, evt_files[index])
+        done = len(unchanged)
+
+        try:
+            for done, next_done in enumerate(asyncio.as_completed(tasks), done + 1):
+                index, result = await next_done
+                batch.record(index, result)
+
+                if progress_callback:
+                    progress_callback(done, total, evt_files[index])
+
+                # Stop on first error if continue_on_error is False
+                if result.status is ConversionStatus.FAILED and not continue_on_error:
+                    raise ConversionError(
+                        f"Conversion failed for {evt_files[index]}: "
+                        f"{result.error_message}"
+                    )
+        finally:
+            # Stop anything still queued or running, and let it clean up
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        batch.flush_manifest()
+
+    # Create summary
+    return batch.summary(_seconds_since(start_time))
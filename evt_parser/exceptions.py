@@ -2,6 +2,10 @@
 
 This module defines the exception hierarchy used throughout the converter library
 to handle various error conditions during validation and conversion.
+
+Exceptions keep their constructor arguments as ``args`` and build their message
+in ``__str__``, so the message is only formatted when it is shown and the
+exceptions survive pickling (e.g. when raised in a batch worker process).
 """
 
 from __future__ import annotations
@@ -33,9 +37,12 @@ class PlatformNotSupportedError(EvtConverterError):
             platform: The name of the detected operating system platform.
         """
         self.platform = platform
-        super().__init__(
+        super().__init__(platform)
+
+    def __str__(self) -> str:
+        return (
             f"EVT to EVTX conversion is only supported on Windows. "
-            f"Current platform: {platform}"
+            f"Current platform: {self.platform}"
         )
 
 
@@ -46,8 +53,8 @@ class WevtutilNotFoundError(EvtConverterError):
     utilities or they are not in the system PATH.
     """
 
-    def __init__(self) -> None:
-        super().__init__(
+    def __str__(self) -> str:
+        return (
             "wevtutil command not found. Ensure Windows Event Log utilities "
             "are installed and available in the system PATH."
         )
@@ -75,8 +82,12 @@ class EvtDirtyFlagError(FileValidationError):
 
     def __init__(self, file_path: str) -> None:
         self.file_path = file_path
-        super().__init__(
-            f"EVT file has DIRTY flag set (copied from running system): {file_path}. "
+        super().__init__(file_path)
+
+    def __str__(self) -> str:
+        return (
+            f"EVT file has DIRTY flag set (copied from running system): "
+            f"{self.file_path}. "
             "Enable auto_repair or manually clear the flag at offset 0x24."
         )
 
@@ -101,16 +112,19 @@ class ConversionError(EvtConverterError):
             return_code: The exit code returned by wevtutil (if available).
             stderr: Error output from wevtutil (if available).
         """
+        self.message = message
         self.return_code = return_code
         self.stderr = stderr
+        super().__init__(message, return_code, stderr)
 
-        error_parts = [message]
-        if return_code is not None:
-            error_parts.append(f"Return code: {return_code}")
-        if stderr:
-            error_parts.append(f"Error output: {stderr}")
+    def __str__(self) -> str:
+        error_parts = [self.message]
+        if self.return_code is not None:
+            error_parts.append(f"Return code: {self.return_code}")
+        if self.stderr:
+            error_parts.append(f"Error output: {self.stderr}")
 
-        super().__init__(" | ".join(error_parts))
+        return " | ".join(error_parts)
 
 
 class ParserError(EvtConverterError):
@@ -133,10 +147,13 @@ class CorruptedEvtError(ParserError):
     def __init__(self, file_path: str, details: Optional[str] = None) -> None:
         self.file_path = file_path
         self.details = details
-        message = f"Corrupted EVT file: {file_path}"
-        if details:
-            message += f" ({details})"
-        super().__init__(message)
+        super().__init__(file_path, details)
+
+    def __str__(self) -> str:
+        message = f"Corrupted EVT file: {self.file_path}"
+        if self.details:
+            message += f" ({self.details})"
+        return message
 
 
 class OutputFormatError(EvtConverterError):
@@ -149,7 +166,11 @@ class OutputFormatError(EvtConverterError):
     """
 
     def __init__(self, message: str, format_name: Optional[str] = None) -> None:
+        self.message = message
         self.format_name = format_name
-        if format_name:
-            message = f"[{format_name}] {message}"
-        super().__init__(message)
+        super().__init__(message, format_name)
+
+    def __str__(self) -> str:
+        if self.format_name:
+            return f"[{self.format_name}] {self.message}"
+        return self.message
@@ -3,22 +3,70 @@
 Supports JSON, XML, and CSV output formats with configurable options.
 """
 
+import base64
 import csv
 import io
 import json
 from abc import ABC, abstractmethod
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TextIO, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 from xml.etree import ElementTree as ET
-from xml.dom import minidom
 
-from .parser import EventRecord, ParseResult
+from .parser import EventRecord, ParseResult, _isoformat
+
+try:
+    # Optional C accelerator; the stdlib encoder is used when it is missing
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+
+def _indent_xml(element: ET.Element, space: str = "  ", level: int = 0) -> None:
+    """Indent an element's descendants in place, like ``ET.indent()``.
+
+    ``ET.indent()`` is used where available (Python 3.9+); this is the same
+    algorithm for Python 3.8. Text of leaf elements is left untouched.
+    """
+    indent = getattr(ET, "indent", None)
+    if indent is not None:
+        indent(element, space=space, level=level)
+        return
+
+    def indent_children(parent: ET.Element, depth: int) -> None:
+        child_indentation = "\n" + space * (depth + 1)
+        if not parent.text or not parent.text.strip():
+            parent.text = child_indentation
+        for child in parent:
+            if len(child):
+                indent_children(child, depth + 1)
+            if not child.tail or not child.tail.strip():
+                child.tail = child_indentation
+        if not (child.tail or "").strip():
+            child.tail = "\n" + space * depth
+
+    if len(element):
+        indent_children(element, level)
 
 
 class Formatter(ABC):
     """Base class for output formatters."""
 
+    #: Newline mode output files should be opened with (see ``open()``).
+    newline: Optional[str] = None
+
     @abstractmethod
     def format(self, result: ParseResult, include_metadata: bool = True) -> str:
         """Format parse result to string."""
@@ -29,18 +77,43 @@ class Formatter(ABC):
         """Format records only (no metadata)."""
         pass
 
+    def format_to(
+        self, result: ParseResult, output: TextIO, include_metadata: bool = True
+    ) -> None:
+        """Write formatted parse result to an open text stream.
+
+        Produces the same text as format(). Subclasses override this to emit
+        records one at a time instead of building the whole document first.
+        """
+        output.write(self.format(result, include_metadata))
+
+    def write_batches(
+        self, output: TextIO, batches: Iterable[List[EventRecord]]
+    ) -> None:
+        """Write batches of records (see iter_evt_record_batches()) to a stream.
+
+        Produces the same text as format_records() for all the records.
+        Subclasses override this to write each batch as it arrives instead of
+        collecting every record first.
+        """
+        output.write(self.format_records([r for batch in batches for r in batch]))
+
     def write(
         self,
         result: ParseResult,
         output: Union[Path, TextIO],
         include_metadata: bool = True,
     ) -> None:
-        """Write formatted output to file or stream."""
-        content = self.format(result, include_metadata)
+        """Write formatted output to file or stream.
+
+        The output is streamed with format_to(), so no complete document string
+        is built in memory.
+        """
         if isinstance(output, Path):
-            output.write_text(content, encoding="utf-8")
+            with output.open("w", encoding="utf-8", newline=self.newline) as fp:
+                self.format_to(result, fp, include_metadata)
         else:
-            output.write(content)
+            self.format_to(result, output, include_metadata)
 
 
 class JsonFormatter(Formatter):
@@ -55,52 +128,120 @@ class JsonFormatter(Formatter):
         """
         self.indent = indent if indent > 0 else None
         self.ensure_ascii = ensure_ascii
+        # Built once and reused for every document and record
+        self._encoder = json.JSONEncoder(
+            indent=self.indent,
+            ensure_ascii=self.ensure_ascii,
+            default=self._json_default,
+        )
+        # orjson only reproduces the stdlib layout for 2-space indentation
+        # without ASCII escaping, so other settings stay on the stdlib path.
+        self._orjson_option: Optional[int] = None
+        if orjson is not None and self.indent == 2 and not self.ensure_ascii:
+            self._orjson_option = (
+                orjson.OPT_INDENT_2
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
 
     def format(self, result: ParseResult, include_metadata: bool = True) -> str:
         """Format parse result as JSON."""
         output: Dict[str, Any] = {}
 
         if include_metadata:
-            output["metadata"] = {
-                "source_file": str(result.source_file),
-                "total_records": result.total_records,
-                "valid_records": result.valid_records,
-                "parse_errors": result.parse_errors,
-                "parse_duration_seconds": round(result.parse_duration_seconds, 3),
-                "header": {
-                    "major_version": result.header.major_version,
-                    "minor_version": result.header.minor_version,
-                    "is_dirty": result.header.is_dirty,
-                    "is_wrapped": result.header.is_wrapped,
-                    "max_size": result.header.max_size,
-                },
-            }
-            if result.errors:
-                output["metadata"]["errors"] = result.errors
+            output["metadata"] = self._metadata(result)
 
         output["records"] = [r.to_dict() for r in result.records]
 
-        return json.dumps(
-            output,
-            indent=self.indent,
-            ensure_ascii=self.ensure_ascii,
-            default=self._json_default,
-        )
+        return self._dumps(output)
+
+    def format_to(
+        self, result: ParseResult, output: TextIO, include_metadata: bool = True
+    ) -> None:
+        """Write parse result as JSON, serializing one record at a time."""
+        if self.indent is None:
+            outer, inner, separator, closing = "", "", ", ", ""
+        else:
+            outer = "\n" + " " * self.indent
+            inner = outer + " " * self.indent
+            separator, closing = ",", "\n"
+
+        output.write("{" + outer)
+        if include_metadata:
+            metadata = self._dumps(self._metadata(result)).replace("\n", outer)
+            output.write(f'"metadata": {metadata},' + (outer or " "))
+
+        output.write('"records": ')
+        if not result.records:
+            output.write("[]")
+        else:
+            output.write("[")
+            for i, record in enumerate(result.records):
+                if i:
+                    output.write(separator)
+                output.write(inner + self._dumps(record.to_dict()).replace("\n", inner))
+            output.write(outer + "]")
+        output.write(closing + "}")
 
     def format_records(self, records: List[EventRecord]) -> str:
         """Format records only as JSON array."""
-        return json.dumps(
-            [r.to_dict() for r in records],
-            indent=self.indent,
-            ensure_ascii=self.ensure_ascii,
-            default=self._json_default,
-        )
+        return self._dumps([r.to_dict() for r in records])
+
+    def write_batches(
+        self, output: TextIO, batches: Iterable[List[EventRecord]]
+    ) -> None:
+        """Write batches of records as one JSON array, serializing a batch per call."""
+        # Each batch is dumped as an array; its items are spliced into one array
+        closing = "]" if self.indent is None else "\n]"
+        separator = ", " if self.indent is None else ","
+        output.write("[")
+        written = False
+        for batch in batches:
+            if not batch:
+                continue
+            items = self._dumps([r.to_dict() for r in batch])[1 : -len(closing)]
+            output.write(separator + items if written else items)
+            written = True
+        output.write(closing if written else "]")
+
+    def _dumps(self, obj: Any) -> str:
+        """Serialize an object with this formatter's options."""
+        if self._orjson_option is not None:
+            try:
+                return orjson.dumps(
+                    obj, default=self._json_default, option=self._orjson_option
+                ).decode("utf-8")
+            except TypeError:
+                # e.g. integers beyond 64 bits; the stdlib encoder decides
+                pass
+        return self._encoder.encode(obj)
+
+    @staticmethod
+    def _metadata(result: ParseResult) -> Dict[str, Any]:
+        """Build the metadata section for a parse result."""
+        metadata: Dict[str, Any] = {
+            "source_file": str(result.source_file),
+            "total_records": result.total_records,
+            "valid_records": result.valid_records,
+            "parse_errors": result.parse_errors,
+            "parse_duration_seconds": round(result.parse_duration_seconds, 3),
+            "header": {
+                "major_version": result.header.major_version,
+                "minor_version": result.header.minor_version,
+                "is_dirty": result.header.is_dirty,
+                "is_wrapped": result.header.is_wrapped,
+                "max_size": result.header.max_size,
+            },
+        }
+        if result.errors:
+            metadata["errors"] = result.errors
+        return metadata
 
     @staticmethod
     def _json_default(obj: Any) -> Any:
         """Handle non-serializable types."""
         if isinstance(obj, datetime):
-            return obj.isoformat()
+            return _isoformat(obj)
         if isinstance(obj, bytes):
             return obj.hex()
         if isinstance(obj, Path):
@@ -123,94 +264,189 @@ class XmlFormatter(Formatter):
 
     def format(self, result: ParseResult, include_metadata: bool = True) -> str:
         """Format parse result as XML."""
-        root = ET.Element("EventLog")
-
-        if include_metadata:
-            meta = ET.SubElement(root, "Metadata")
-            ET.SubElement(meta, "SourceFile").text = str(result.source_file)
-            ET.SubElement(meta, "TotalRecords").text = str(result.total_records)
-            ET.SubElement(meta, "ValidRecords").text = str(result.valid_records)
-            ET.SubElement(meta, "ParseErrors").text = str(result.parse_errors)
-            ET.SubElement(meta, "ParseDuration").text = (
-                f"{result.parse_duration_seconds:.3f}"
-            )
+        output = io.StringIO()
+        self.format_to(result, output, include_metadata)
+        return output.getvalue()
 
-            header = ET.SubElement(meta, "Header")
-            ET.SubElement(header, "MajorVersion").text = str(
-                result.header.major_version
-            )
-            ET.SubElement(header, "MinorVersion").text = str(
-                result.header.minor_version
-            )
-            ET.SubElement(header, "IsDirty").text = str(result.header.is_dirty).lower()
-            ET.SubElement(header, "IsWrapped").text = str(
-                result.header.is_wrapped
-            ).lower()
+    def format_to(
+        self, result: ParseResult, output: TextIO, include_metadata: bool = True
+    ) -> None:
+        """Write parse result as XML, serializing one event at a time.
 
-            if result.errors:
-                errors = ET.SubElement(meta, "Errors")
-                for error in result.errors:
-                    ET.SubElement(errors, "Error").text = error
+        Events are written as markup strings directly rather than built as
+        ElementTree elements first, so no per-field element objects are made.
+        """
+        if self.pretty:
+            output.write('<?xml version="1.0" ?>\n<EventLog>\n')
+        else:
+            output.write("<EventLog>")
 
-        events = ET.SubElement(root, "Events")
-        for record in result.records:
-            self._add_event_element(events, record)
+        if include_metadata:
+            self._write_element(output, self._metadata_element(result), level=1)
 
-        return self._to_string(root)
+        self._write_events(output, [result.records], level=1)
+        output.write("\n</EventLog>" if self.pretty else "</EventLog>")
 
     def format_records(self, records: List[EventRecord]) -> str:
         """Format records only as XML."""
-        root = ET.Element("Events")
-        for record in records:
-            self._add_event_element(root, record)
-        return self._to_string(root)
+        output = io.StringIO()
+        self.write_batches(output, [records])
+        return output.getvalue()
 
-    def _add_event_element(self, parent: ET.Element, record: EventRecord) -> None:
-        """Add an event record as XML element."""
-        event = ET.SubElement(parent, "Event")
-        event.set("RecordNumber", str(record.record_number))
+    def write_batches(
+        self, output: TextIO, batches: Iterable[List[EventRecord]]
+    ) -> None:
+        """Write batches of records as an <Events> document, one write per batch."""
+        if self.pretty:
+            output.write('<?xml version="1.0" ?>\n')
+        self._write_events(output, batches, level=0)
 
-        ET.SubElement(event, "TimeGenerated").text = (
-            record.time_generated.isoformat() if record.time_generated else ""
-        )
-        ET.SubElement(event, "TimeWritten").text = (
-            record.time_written.isoformat() if record.time_written else ""
+    def _write_events(
+        self, output: TextIO, batches: Iterable[List[EventRecord]], level: int
+    ) -> None:
+        """Write the <Events> element for records as it appears at ``level``.
+
+        The closing tag isn't followed by a newline.
+        """
+        indent = "  " * level if self.pretty else ""
+        newline = "\n" if self.pretty else ""
+        event_indent = indent + "  " if self.pretty else ""
+        event_xml = self._event_xml
+
+        opened = False
+        for batch in batches:
+            if not batch:
+                continue
+            if not opened:
+                output.write(f"{indent}<Events>{newline}")
+                opened = True
+            output.write(
+                "".join(
+                    event_indent + event_xml(record, level + 1) + newline
+                    for record in batch
+                )
+            )
+        if opened:
+            output.write(f"{indent}</Events>")
+        else:
+            output.write(f"{indent}<Events />")
+
+    def _metadata_element(self, result: ParseResult) -> ET.Element:
+        """Build the metadata element for a parse result."""
+        meta = ET.Element("Metadata")
+        ET.SubElement(meta, "SourceFile").text = str(result.source_file)
+        ET.SubElement(meta, "TotalRecords").text = str(result.total_records)
+        ET.SubElement(meta, "ValidRecords").text = str(result.valid_records)
+        ET.SubElement(meta, "ParseErrors").text = str(result.parse_errors)
+        ET.SubElement(meta, "ParseDuration").text = (
+            f"{result.parse_duration_seconds:.3f}"
         )
-        ET.SubElement(event, "EventID").text = str(record.event_id)
-        ET.SubElement(event, "EventType").text = record.event_type
-        ET.SubElement(event, "EventCategory").text = str(record.event_category)
-        ET.SubElement(event, "Source").text = record.source
-        ET.SubElement(event, "ComputerName").text = record.computer_name
+
+        header = ET.SubElement(meta, "Header")
+        ET.SubElement(header, "MajorVersion").text = str(result.header.major_version)
+        ET.SubElement(header, "MinorVersion").text = str(result.header.minor_version)
+        ET.SubElement(header, "IsDirty").text = str(result.header.is_dirty).lower()
+        ET.SubElement(header, "IsWrapped").text = str(result.header.is_wrapped).lower()
+
+        if result.errors:
+            errors = ET.SubElement(meta, "Errors")
+            for error in result.errors:
+                ET.SubElement(errors, "Error").text = error
+
+        return meta
+
+    def _event_xml(self, record: EventRecord, level: int) -> str:
+        """Serialize an event record as it appears at ``level`` in a document.
+
+        Produces the same markup ElementTree writes for the equivalent
+        (indented, when pretty) element tree.
+        """
+        if self.pretty:
+            closing = "\n" + "  " * level
+            child = closing + "  "
+        else:
+            closing = child = ""
+
+        parts = [
+            f'<Event RecordNumber="{record.record_number}">',
+            child,
+            _xml_leaf(
+                "TimeGenerated",
+                _isoformat(record.time_generated) if record.time_generated else "",
+            ),
+            child,
+            _xml_leaf(
+                "TimeWritten",
+                _isoformat(record.time_written) if record.time_written else "",
+            ),
+            child,
+            f"<EventID>{record.event_id}</EventID>",
+            child,
+            _xml_leaf("EventType", record.event_type),
+            child,
+            f"<EventCategory>{record.event_category}</EventCategory>",
+            child,
+            _xml_leaf("Source", record.source),
+            child,
+            _xml_leaf("ComputerName", record.computer_name),
+        ]
 
         if record.user_sid:
-            ET.SubElement(event, "UserSID").text = record.user_sid
+            parts += (child, _xml_leaf("UserSID", record.user_sid))
 
         if record.strings:
-            strings = ET.SubElement(event, "Strings")
+            string_indent = child + "  " if self.pretty else ""
+            parts += (child, "<Strings>")
             for i, s in enumerate(record.strings):
-                string_elem = ET.SubElement(strings, "String")
-                string_elem.set("Index", str(i))
-                string_elem.text = s
+                parts += (string_indent, _xml_leaf("String", s, f' Index="{i}"'))
+            parts += (child, "</Strings>")
 
         if record.data:
-            ET.SubElement(event, "Data").text = record.data.hex()
+            parts += (child, f"<Data>{record.data.hex()}</Data>")
 
-    def _to_string(self, root: ET.Element) -> str:
-        """Convert XML element to string."""
-        if self.pretty:
-            xml_str = ET.tostring(root, encoding="unicode")
-            parsed = minidom.parseString(xml_str)
-            pretty_xml = parsed.toprettyxml(indent="  ")
-            # Remove extra blank lines
-            lines = [line for line in pretty_xml.split("\n") if line.strip()]
-            return "\n".join(lines)
-        else:
-            return ET.tostring(root, encoding="unicode")
+        parts += (closing, "</Event>")
+        return "".join(parts)
+
+    def _write_element(self, output: TextIO, element: ET.Element, level: int) -> None:
+        """Write one element as it appears at ``level`` inside a full document."""
+        if not self.pretty:
+            output.write(ET.tostring(element, encoding="unicode"))
+            return
+
+        _indent_xml(element, level=level)
+        output.write("  " * level + ET.tostring(element, encoding="unicode") + "\n")
+
+
+def _xml_leaf(tag: str, text: str, attributes: str = "") -> str:
+    """Serialize a text-only element the way ElementTree writes it."""
+    if not text:
+        return f"<{tag}{attributes} />"
+    return f"<{tag}{attributes}>{_escape_xml_text(text)}</{tag}>"
+
+
+def _escape_xml_text(text: str) -> str:
+    """Escape character data exactly as ElementTree does."""
+    # Checking first avoids do-nothing replace() calls on most strings
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+# Escapes for control characters in CSV cells (see _sanitize_csv_cell())
+_CSV_CONTROL_ESCAPES = {code: f"\\x{code:02x}" for code in range(0x20)}
+_CSV_CONTROL_ESCAPES.update({ord("\n"): "\\n", ord("\r"): "\\n", ord("\t"): "\\t"})
 
 
 class CsvFormatter(Formatter):
     """CSV output formatter."""
 
+    # The csv module writes its own line terminators
+    newline = ""
+
     DEFAULT_COLUMNS = [
         "record_number",
         "time_generated",
@@ -251,35 +487,88 @@ class CsvFormatter(Formatter):
         """
         output = io.StringIO()
 
-        self._write_records(output, result.records)
+        self.write_stream(output, result.records)
         return output.getvalue()
 
+    def format_to(
+        self, result: ParseResult, output: TextIO, include_metadata: bool = True
+    ) -> None:
+        """Write parse result as CSV rows.
+
+        File streams should be opened with ``newline=""`` (see ``newline``).
+        """
+        self.write_stream(output, result.records)
+
     def format_records(self, records: List[EventRecord]) -> str:
         """Format records only as CSV."""
         output = io.StringIO()
-        self._write_records(output, records)
+        self.write_stream(output, records)
         return output.getvalue()
 
-    def _write_records(self, output: TextIO, records: List[EventRecord]) -> None:
-        """Write records to CSV output."""
+    def write_stream(self, output: TextIO, records: Iterable[EventRecord]) -> None:
+        """Write records as CSV rows to an open text stream.
+
+        Records are consumed as they are written, so passing a generator such
+        as iter_evt_records() keeps only one record in memory at a time. One
+        csv writer serves the whole stream. File streams should be opened with
+        ``newline=""`` (see ``newline``).
+        """
+        writer = csv.writer(output, delimiter=self.delimiter)
+
+        if self.include_header:
+            writer.writerow(self.columns)
+
+        # A single writerows() call lets the C writer drive the row loop
+        writer.writerows(self._rows(records))
+
+    def write_batches(
+        self, output: TextIO, batches: Iterable[List[EventRecord]]
+    ) -> None:
+        """Write batches of records as CSV rows, one writerows() call per batch."""
         writer = csv.writer(output, delimiter=self.delimiter)
 
         if self.include_header:
             writer.writerow(self.columns)
 
+        for batch in batches:
+            writer.writerows(self._rows(batch))
+
+    def _rows(self, records: Iterable[EventRecord]) -> Iterator[List[Any]]:
+        """Yield one list of cell values per record, in column order."""
+        getters = [self._cell_getter(col) for col in self.columns]
+
         for record in records:
-            row = []
-            record_dict = record.to_dict()
-            for col in self.columns:
-                value = record_dict.get(col, "")
-                if col == "strings" and isinstance(value, list):
-                    value = json.dumps(value, ensure_ascii=False)
-                elif value is None:
-                    value = ""
-                elif isinstance(value, str):
-                    value = self._sanitize_csv_cell(value)
-                row.append(value)
-            writer.writerow(row)
+            yield [get(record) for get in getters]
+
+    def _cell_getter(self, column: str) -> Callable[[EventRecord], Any]:
+        """Return a function computing one column's cell for a record.
+
+        Cells are read straight off the record, so only the selected columns
+        are converted (no to_dict() per row). Values match to_dict(): unknown
+        columns are empty, and text cells are sanitized.
+        """
+        sanitize = self._sanitize_csv_cell
+
+        if column in ("record_number", "event_id", "event_category"):
+            return attrgetter(column)
+        if column in ("event_type", "source", "computer_name", "user_sid"):
+            get_text = attrgetter(column)
+            return lambda record: sanitize(get_text(record) or "")
+        if column in ("time_generated", "time_written"):
+            get_time = attrgetter(column)
+
+            def iso_time(record: EventRecord) -> str:
+                value = get_time(record)
+                return _isoformat(value) if value else ""
+
+            return iso_time
+        if column == "strings":
+            return lambda record: json.dumps(record.strings, ensure_ascii=False)
+        if column == "data":
+            return lambda record: (
+                base64.b64encode(record.data).decode("ascii") if record.data else ""
+            )
+        return lambda record: ""
 
     @staticmethod
     def _sanitize_csv_cell(value: str) -> str:
@@ -291,17 +580,21 @@ class CsvFormatter(Formatter):
         if not value:
             return value
 
-        value = value.replace("\r\n", "\\n").replace("\r", "\\n").replace("\n", "\\n")
-        value = value.replace("\t", "\\t")
+        # A CRLF pair becomes a single \n; the table maps lone CRs on their own
+        if "\r\n" in value:
+            value = value.replace("\r\n", "\n")
+        return value.translate(_CSV_CONTROL_ESCAPES)
+
 
-        sanitized: list[str] = []
-        for ch in value:
-            code = ord(ch)
-            if code < 0x20:
-                sanitized.append(f"\\x{code:02x}")
-            else:
-                sanitized.append(ch)
-        return "".join(sanitized)
+# Formatter registry, keyed by lower-case format name
+_FORMATTERS: Dict[str, Callable[..., Formatter]] = {
+    "json": JsonFormatter,
+    "xml": XmlFormatter,
+    "csv": CsvFormatter,
+}
+
+#: Names accepted by get_formatter(), in display order.
+FORMATS: Tuple[str, ...] = tuple(_FORMATTERS)
 
 
 def get_formatter(format_name: str, **kwargs: Any) -> Formatter:
@@ -317,16 +610,8 @@ def get_formatter(format_name: str, **kwargs: Any) -> Formatter:
     Raises:
         ValueError: If format_name is not recognized.
     """
-    formatters: Dict[str, Callable[..., Formatter]] = {
-        "json": JsonFormatter,
-        "xml": XmlFormatter,
-        "csv": CsvFormatter,
-    }
-
     format_lower = format_name.lower()
-    if format_lower not in formatters:
-        raise ValueError(
-            f"Unknown format: {format_name}. Available: {list(formatters.keys())}"
-        )
+    if format_lower not in _FORMATTERS:
+        raise ValueError(f"Unknown format: {format_name}. Available: {list(FORMATS)}")
 
-    return formatters[format_lower](**kwargs)
+    return _FORMATTERS[format_lower](**kwargs)
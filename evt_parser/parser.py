@@ -17,13 +17,17 @@ from __future__ import annotations
 import base64
 import struct
 import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 import mmap
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
 
 from .exceptions import FileValidationError
+from .utils import DATACLASS_SLOTS
 
 
 # EVT Header constants
@@ -33,6 +37,35 @@ EVT_SIGNATURE = b"LfLe"
 EVT_SIGNATURE_OFFSET = 0x04
 EVT_EOF_SIGNATURE = bytes.fromhex("11111111222222223333333344444444")
 
+# Signatures as little-endian integers, compared without slicing the buffer
+_EVT_SIGNATURE_INT = int.from_bytes(EVT_SIGNATURE, "little")
+_EOF_SIGNATURE_INT = int.from_bytes(EVT_EOF_SIGNATURE[:4], "little")  # 0x11111111
+
+# Fixed-size layouts, little-endian (offsets from the libevt specification)
+# 0x00 size, 0x04 signature, 0x08 major/minor version, 0x10 start/end offset,
+# 0x18 current/oldest record number, 0x20 max size, flags, retention, size copy
+_HEADER_STRUCT = struct.Struct("<I4s10I")
+# 0x00 size, 0x04 signature (as an integer)
+_RECORD_PREFIX_STRUCT = struct.Struct("<II")
+_UINT32_STRUCT = struct.Struct("<I")
+# 0x08 record number, 0x0C/0x10 time generated/written, 0x14 event ID,
+# 0x18 event type, string count, category, 0x1E reserved flags and closing
+# record number (skipped), 0x24 string offset, 0x28 SID length/offset,
+# 0x30 data length/offset
+_RECORD_STRUCT = struct.Struct("<8xIIIIHHH6xIIIII")
+
+_UTC = timezone.utc
+
+# Shared source/computer name strings, see _intern_str()
+_INTERNED_STRINGS: Dict[str, str] = {}
+_INTERNED_STRINGS_LIMIT = 4096
+
+# Layout of a SID's sub-authorities, indexed by the (one byte) count
+_SID_SUB_AUTHORITY_STRUCTS = tuple(struct.Struct(f"<{n}I") for n in range(256))
+
+#: Fewest records parse_evt_file() spreads across worker processes.
+PARALLEL_PARSE_MIN_RECORDS = 20_000
+
 # Event type mappings
 EVENT_TYPE_MAP = {
     1: "error",
@@ -43,7 +76,7 @@ EVENT_TYPE_MAP = {
 }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EvtHeader:
     """Parsed EVT file header."""
 
@@ -69,9 +102,13 @@ class EvtHeader:
         return bool(self.flags & 0x02)
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class EventRecord:
-    """Parsed event record from an EVT file."""
+    """Parsed event record from an EVT file.
+
+    raw_record holds the record's raw bytes only when parsed with
+    ``keep_raw=True``; otherwise it is None.
+    """
 
     record_number: int
     time_generated: Optional[datetime]
@@ -85,17 +122,17 @@ class EventRecord:
     user_sid: Optional[str]
     strings: List[str]
     data: Optional[bytes]
-    raw_record: bytes = field(repr=False)
+    raw_record: Optional[bytes] = field(default=None, repr=False)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "record_number": self.record_number,
             "time_generated": (
-                self.time_generated.isoformat() if self.time_generated else None
+                _isoformat(self.time_generated) if self.time_generated else None
             ),
             "time_written": (
-                self.time_written.isoformat() if self.time_written else None
+                _isoformat(self.time_written) if self.time_written else None
             ),
             "event_id": self.event_id,
             "event_type": self.event_type,
@@ -108,7 +145,7 @@ class EventRecord:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ParseResult:
     """Result of parsing an EVT file."""
 
@@ -131,18 +168,20 @@ def _parse_header(data: bytes) -> EvtHeader:
     if len(data) < EVT_HEADER_SIZE:
         raise FileValidationError(f"File too small for EVT header: {len(data)} bytes")
 
-    header_size = struct.unpack("<I", data[0:4])[0]
-    signature = data[4:8]
-    major_version = struct.unpack("<I", data[8:12])[0]
-    minor_version = struct.unpack("<I", data[12:16])[0]
-    start_offset = struct.unpack("<I", data[16:20])[0]
-    end_offset = struct.unpack("<I", data[20:24])[0]
-    current_record_number = struct.unpack("<I", data[24:28])[0]
-    oldest_record_number = struct.unpack("<I", data[28:32])[0]
-    max_size = struct.unpack("<I", data[32:36])[0]
-    flags = struct.unpack("<I", data[36:40])[0]
-    retention = struct.unpack("<I", data[40:44])[0]
-    header_size_copy = struct.unpack("<I", data[44:48])[0]
+    (
+        header_size,
+        signature,
+        major_version,
+        minor_version,
+        start_offset,
+        end_offset,
+        current_record_number,
+        oldest_record_number,
+        max_size,
+        flags,
+        retention,
+        header_size_copy,
+    ) = _HEADER_STRUCT.unpack_from(data)
 
     if signature != EVT_SIGNATURE:
         raise FileValidationError(
@@ -165,85 +204,125 @@ def _parse_header(data: bytes) -> EvtHeader:
     )
 
 
+@lru_cache(maxsize=4096)
 def _unix_to_datetime(timestamp: int) -> Optional[datetime]:
-    """Convert Unix timestamp to datetime, handling edge cases."""
+    """Convert Unix timestamp to datetime, handling edge cases.
+
+    Cached because records written close together share timestamps; datetimes
+    are immutable, so records can share the same instance.
+    """
     if timestamp == 0:
         return None
     try:
-        return datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return datetime.fromtimestamp(timestamp, tz=_UTC)
     except (ValueError, OSError, OverflowError):
         return None
 
 
+@lru_cache(maxsize=4096)
+def _utc_isoformat(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _isoformat(value: datetime) -> str:
+    """Format a datetime as ISO 8601, caching UTC values.
+
+    Parsed records share datetime instances (see _unix_to_datetime), so the
+    formatters would otherwise build the same string over and over. Only UTC
+    values are cached: equal datetimes in other zones render differently.
+    """
+    if value.tzinfo is _UTC:
+        return _utc_isoformat(value)
+    return value.isoformat()
+
+
 def _read_null_terminated_utf16(
     data: bytes, offset: int, max_len: int = 1024
 ) -> tuple[str, int]:
-    """Read a null-terminated UTF-16LE string from data."""
-    end = offset
-    while end < min(offset + max_len, len(data) - 1):
-        if data[end] == 0 and data[end + 1] == 0:
-            break
-        end += 2
-
-    try:
-        string = data[offset:end].decode("utf-16-le")
-    except UnicodeDecodeError:
-        string = data[offset:end].decode("utf-16-le", errors="replace")
+    """Read a null-terminated UTF-16LE string from data.
 
+    The terminator is a null code unit: a 0x0000 pair at an even distance from
+    offset, starting within max_len bytes. The search runs in C via find(),
+    skipping pairs that straddle two code units (e.g. "A" followed by U+0100).
+    """
+    limit = min(offset + max_len, len(data) - 1)  # Terminator must start before
+    end = data.find(b"\x00\x00", offset, limit + 1)
+    while end >= 0 and (end - offset) % 2:
+        end = data.find(b"\x00\x00", end + 1, limit + 1)
+    if end < 0:
+        # Unterminated: take every whole code unit up to the limit
+        end = limit + (limit - offset) % 2 if limit > offset else offset
+
+    string = data[offset:end].decode("utf-16-le", errors="replace")
     return string, end + 2
 
 
+def _intern_str(value: str) -> str:
+    """Return a shared copy of a frequently repeated string.
+
+    Logs have few distinct sources and computers, so records can share one
+    string object each. The cache is bounded so hostile input cannot grow it
+    without limit.
+    """
+    cached = _INTERNED_STRINGS.get(value)
+    if cached is not None:
+        return cached
+    if len(_INTERNED_STRINGS) < _INTERNED_STRINGS_LIMIT:
+        _INTERNED_STRINGS[value] = value
+    return value
+
+
+@lru_cache(maxsize=1024)
 def _parse_sid(data: bytes) -> Optional[str]:
-    """Parse a Windows SID from binary data."""
+    """Parse a Windows SID from binary data.
+
+    Cached by the SID's bytes, since a log usually has only a few distinct
+    accounts.
+    """
     if not data or len(data) < 8:
         return None
 
-    try:
-        revision = data[0]
-        sub_auth_count = data[1]
+    revision = data[0]
+    sub_auth_count = data[1]
 
-        if len(data) < 8 + sub_auth_count * 4:
-            return None
+    if len(data) < 8 + sub_auth_count * 4:
+        return None
 
-        # 6-byte identifier authority (big-endian)
-        id_auth = int.from_bytes(data[2:8], "big")
+    # 6-byte identifier authority (big-endian)
+    id_auth = int.from_bytes(data[2:8], "big")
 
-        # Sub-authorities (little-endian)
-        sub_auths = []
-        for i in range(sub_auth_count):
-            offset = 8 + i * 4
-            sub_auth = struct.unpack("<I", data[offset : offset + 4])[0]
-            sub_auths.append(str(sub_auth))
+    # Sub-authorities (little-endian), unpacked in one call
+    sub_auths = _SID_SUB_AUTHORITY_STRUCTS[sub_auth_count].unpack_from(data, 8)
 
-        return f"S-{revision}-{id_auth}-" + "-".join(sub_auths)
-    except Exception:
-        return None
+    return f"S-{revision}-{id_auth}-" + "-".join(map(str, sub_auths))
 
 
 def _parse_event_record(
-    data: Union[bytes, mmap.mmap], offset: int
+    data: Union[bytes, mmap.mmap], offset: int, keep_raw: bool = False
 ) -> tuple[Optional[EventRecord], int, Optional[str]]:
     """Parse a single event record from the data.
 
+    The record's raw bytes are kept on the returned record only if keep_raw.
+
     Returns: (record, next_offset, error_message)
     """
     if offset + 8 > len(data):
         return None, offset, "Insufficient data for record header"
 
     # Read record size and signature
-    record_size = struct.unpack("<I", data[offset : offset + 4])[0]
-    signature = data[offset + 4 : offset + 8]
+    record_size, signature = _RECORD_PREFIX_STRUCT.unpack_from(data, offset)
 
     # Check for EOF record
-    if signature == EVT_EOF_SIGNATURE[:4]:
+    if signature == _EOF_SIGNATURE_INT:
         return None, offset + 40, None  # EOF record is 40 bytes
 
     # Validate record
-    if signature != EVT_SIGNATURE:
+    if signature != _EVT_SIGNATURE_INT:
+        signature_hex = signature.to_bytes(4, "little").hex()
         return (
             None,
             offset + 4,
-            f"Invalid record signature at offset {offset}: {signature.hex()}",
+            f"Invalid record signature at offset {offset}: {signature_hex}",
         )
 
     if record_size < EVENTLOGRECORD_HEADER_SIZE or record_size > 65536:
@@ -259,26 +338,28 @@ def _parse_event_record(
     raw_record = data[offset : offset + record_size]
 
     try:
-        record_number = struct.unpack("<I", raw_record[8:12])[0]
-        time_generated = struct.unpack("<I", raw_record[12:16])[0]
-        time_written = struct.unpack("<I", raw_record[16:20])[0]
-
-        event_id_dword = struct.unpack("<I", raw_record[20:24])[0]
+        (
+            record_number,
+            time_generated,
+            time_written,
+            event_id_dword,
+            event_type_raw,
+            num_strings,
+            event_category,
+            string_offset,
+            user_sid_length,
+            user_sid_offset,
+            data_length,
+            data_offset,
+        ) = _RECORD_STRUCT.unpack_from(raw_record)
         event_id = event_id_dword & 0xFFFF
 
-        event_type_raw = struct.unpack("<H", raw_record[24:26])[0]
-        num_strings = struct.unpack("<H", raw_record[26:28])[0]
-        event_category = struct.unpack("<H", raw_record[28:30])[0]
-        string_offset = struct.unpack("<I", raw_record[36:40])[0]
-        user_sid_length = struct.unpack("<I", raw_record[40:44])[0]
-        user_sid_offset = struct.unpack("<I", raw_record[44:48])[0]
-        data_length = struct.unpack("<I", raw_record[48:52])[0]
-        data_offset = struct.unpack("<I", raw_record[52:56])[0]
-
         # Parse source name and computer name (immediately after fixed header)
         var_offset = EVENTLOGRECORD_HEADER_SIZE
         source_name, var_offset = _read_null_terminated_utf16(raw_record, var_offset)
         computer_name, var_offset = _read_null_terminated_utf16(raw_record, var_offset)
+        source_name = _intern_str(source_name)
+        computer_name = _intern_str(computer_name)
 
         # Parse SID if present
         user_sid = None
@@ -326,7 +407,7 @@ def _parse_event_record(
             user_sid=user_sid,
             strings=strings,
             data=event_data,
-            raw_record=raw_record,
+            raw_record=raw_record if keep_raw else None,
         )
 
         return record, offset + record_size, None
@@ -339,11 +420,141 @@ def _parse_event_record(
         )
 
 
-def parse_evt_file(input_file: Union[str, Path]) -> ParseResult:
+def _walk_records(
+    data: Union[bytes, mmap.mmap], offset: int, keep_raw: bool = False
+) -> Iterator[tuple[Optional[EventRecord], Optional[str]]]:
+    """Walk the records from offset up to the EOF record.
+
+    Yields (record, error_message) for each record that has a valid signature,
+    as returned by _parse_event_record().
+    """
+    for record_offset in _record_offsets(data, offset):
+        record, _next_offset, error = _parse_event_record(data, record_offset, keep_raw)
+        yield record, error
+
+
+def _record_offsets(data: Union[bytes, mmap.mmap], offset: int) -> Iterator[int]:
+    """Yield the offset of each record with a valid signature, up to the EOF record.
+
+    Only each record's size and signature are read, so the offsets can be found
+    cheaply before the records are parsed. Where the signature is missing the
+    walk resynchronizes on the next one found, using a C-level search rather
+    than stepping through the bytes in Python.
+    """
+    size = len(data)
+    end = size - 8  # Need at least 8 bytes for record header
+    while offset < end:
+        # Read size and signature once; the signature is compared as an integer
+        record_size, signature = _RECORD_PREFIX_STRUCT.unpack_from(data, offset)
+
+        # Check for EOF signature
+        if signature == _EOF_SIGNATURE_INT:
+            return
+
+        # Check for LfLe signature
+        if signature != _EVT_SIGNATURE_INT:
+            # Try to find next record
+            next_lfle = data.find(EVT_SIGNATURE, offset + 4)
+            if next_lfle == -1:
+                return
+            offset = next_lfle - 4
+            continue
+
+        yield offset
+
+        # Step to the next record the way _parse_event_record() reports it
+        if record_size < EVENTLOGRECORD_HEADER_SIZE or record_size > 65536:
+            offset += 4
+        elif offset + record_size > size:
+            return
+        else:
+            offset += record_size
+
+
+def _parse_records_at(
+    input_path: Path, offsets: List[int], keep_raw: bool
+) -> List[tuple[Optional[EventRecord], Optional[str]]]:
+    """Parse the records at offsets in an EVT file.
+
+    Runs in parse_evt_file()'s worker processes, so it opens the file itself
+    and takes only picklable arguments.
+    """
+    with _evt_file_data(input_path) as data:
+        parsed = []
+        for offset in offsets:
+            record, _next_offset, error = _parse_event_record(data, offset, keep_raw)
+            parsed.append((record, error))
+        return parsed
+
+
+def _parse_records_in_parallel(
+    input_path: Path, offsets: List[int], keep_raw: bool, workers: int
+) -> Iterator[tuple[Optional[EventRecord], Optional[str]]]:
+    """Parse the records at offsets across worker processes, in offset order."""
+    # A few chunks per worker evens out uneven record sizes
+    chunk_size = -(-len(offsets) // (workers * 4))
+    chunks = [offsets[i : i + chunk_size] for i in range(0, len(offsets), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for parsed in executor.map(
+            _parse_records_at,
+            [input_path] * len(chunks),
+            chunks,
+            [keep_raw] * len(chunks),
+        ):
+            yield from parsed
+
+
+def _map_evt_file(f: BinaryIO) -> mmap.mmap:
+    """Map an open EVT file read-only for a front-to-back record walk."""
+    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        # Let the kernel read ahead aggressively
+        try:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        except BaseException:
+            # The caller falls back to read(), so don't leak the mapping
+            mm.close()
+            raise
+    return mm
+
+
+@contextmanager
+def _evt_file_data(input_path: Path) -> Iterator[Union[bytes, mmap.mmap]]:
+    """Open an EVT file's contents for parsing.
+
+    The file is memory-mapped when possible. Files that can't be mapped (e.g.
+    on some network filesystems or special files) are read into ``bytes``.
+    """
+    with input_path.open("rb") as f:
+        try:
+            mm = _map_evt_file(f)
+        except (OSError, ValueError):
+            yield f.read()
+            return
+        with mm:
+            yield mm
+
+
+def parse_evt_file(
+    input_file: Union[str, Path], keep_raw: bool = False, workers: Optional[int] = None
+) -> ParseResult:
     """Parse an EVT file and extract all event records.
 
+    The file is memory-mapped rather than read into a single ``bytes`` object,
+    so pages are loaded on demand and no full-file copy is made.
+
     Args:
         input_file: Path to the EVT file to parse.
+        keep_raw: If True, keep each record's raw bytes in
+                 ``EventRecord.raw_record``. Off by default, since it roughly
+                 doubles the memory a parse result holds.
+        workers: Number of processes to parse records in. By default (or with
+                1) records are parsed in this process. With more, the record
+                offsets are found first and files with at least
+                PARALLEL_PARSE_MIN_RECORDS records are parsed in chunks by a
+                process pool; records are pickled back to this process, so
+                smaller files aren't worth it. As with any process pool, call
+                this under an ``if __name__ == "__main__":`` guard on Windows.
 
     Returns:
         ParseResult with header, records, and statistics.
@@ -357,48 +568,41 @@ def parse_evt_file(input_file: Union[str, Path]) -> ParseResult:
         raise FileValidationError(f"File not found: {input_path}")
 
     start_time = time.time()
-    errors = []
-    records = []
-
-    with input_path.open("rb") as f:
-        data = f.read()
+    errors: List[str] = []
+    records: List[EventRecord] = []
 
-    if len(data) < EVT_HEADER_SIZE:
-        raise FileValidationError(f"File too small to be valid EVT: {len(data)} bytes")
-
-    # Parse header
-    header = _parse_header(data)
-
-    # Parse records starting from start_offset
-    offset = header.start_offset
-    record_count = 0
-
-    while offset < len(data) - 8:  # Need at least 8 bytes for record header
-        # Check for EOF signature
-        if data[offset + 4 : offset + 8] == EVT_EOF_SIGNATURE[:4]:
-            break
-
-        # Check for LfLe signature
-        if data[offset + 4 : offset + 8] != EVT_SIGNATURE:
-            # Try to find next record
-            next_lfle = data.find(EVT_SIGNATURE, offset + 4)
-            if next_lfle == -1:
-                break
-            offset = next_lfle - 4
-            continue
+    file_size = input_path.stat().st_size
+    if file_size < EVT_HEADER_SIZE:
+        raise FileValidationError(f"File too small to be valid EVT: {file_size} bytes")
 
-        record, next_offset, error = _parse_event_record(data, offset)
-        record_count += 1
+    with _evt_file_data(input_path) as data:
+        # Parse header
+        header = _parse_header(data[:EVT_HEADER_SIZE])
+
+        # Parse records starting from start_offset
+        parsed: Iterator[tuple[Optional[EventRecord], Optional[str]]]
+        if workers is not None and workers > 1:
+            offsets = list(_record_offsets(data, header.start_offset))
+            if len(offsets) >= PARALLEL_PARSE_MIN_RECORDS:
+                parsed = _parse_records_in_parallel(
+                    input_path, offsets, keep_raw, workers
+                )
+            else:
+                parsed = _walk_records(data, header.start_offset, keep_raw)
+        else:
+            parsed = _walk_records(data, header.start_offset, keep_raw)
 
-        if error:
-            errors.append(error)
+        add_error = errors.append
+        add_record = records.append
+        record_count = 0
+        for record, error in parsed:
+            record_count += 1
 
-        if record:
-            records.append(record)
+            if error:
+                add_error(error)
 
-        if next_offset <= offset:
-            break
-        offset = next_offset
+            if record:
+                add_record(record)
 
     duration = time.time() - start_time
 
@@ -414,11 +618,14 @@ def parse_evt_file(input_file: Union[str, Path]) -> ParseResult:
     )
 
 
-def iter_evt_records(input_file: Union[str, Path]) -> Iterator[EventRecord]:
+def iter_evt_records(
+    input_file: Union[str, Path], keep_raw: bool = False
+) -> Iterator[EventRecord]:
     """Iterate over EVT records without building a full result list.
 
     This uses a read-only memory map for efficient access to large EVT files while
     avoiding the overhead of reading the entire file into a Python `bytes`.
+    Records carry their raw bytes only if keep_raw is True (see parse_evt_file()).
     """
     input_path = Path(input_file)
 
@@ -429,26 +636,30 @@ def iter_evt_records(input_file: Union[str, Path]) -> Iterator[EventRecord]:
     if file_size < EVT_HEADER_SIZE:
         raise FileValidationError(f"File too small to be valid EVT: {file_size} bytes")
 
-    with input_path.open("rb") as f:
-        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-            header = _parse_header(mm[:EVT_HEADER_SIZE])
-            offset = header.start_offset
-
-            while offset < len(mm) - 8:
-                if mm[offset + 4 : offset + 8] == EVT_EOF_SIGNATURE[:4]:
-                    break
+    with _evt_file_data(input_path) as data:
+        header = _parse_header(data[:EVT_HEADER_SIZE])
+        for record, _error in _walk_records(data, header.start_offset, keep_raw):
+            if record:
+                yield record
 
-                if mm[offset + 4 : offset + 8] != EVT_SIGNATURE:
-                    next_lfle = mm.find(EVT_SIGNATURE, offset + 4)
-                    if next_lfle == -1:
-                        break
-                    offset = next_lfle - 4
-                    continue
 
-                record, next_offset, _error = _parse_event_record(mm, offset)
-                if record:
-                    yield record
+def iter_evt_record_batches(
+    input_file: Union[str, Path], batch_size: int = 1024, keep_raw: bool = False
+) -> Iterator[List[EventRecord]]:
+    """Iterate over EVT records in lists of up to batch_size records.
 
-                if next_offset <= offset:
-                    break
-                offset = next_offset
+    Works like iter_evt_records(), but consumers such as
+    Formatter.write_batches() can handle a whole batch per call instead of
+    paying call overhead for every record.
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+
+    batch: List[EventRecord] = []
+    for record in iter_evt_records(input_file, keep_raw=keep_raw):
+        batch.append(record)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
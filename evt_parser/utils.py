@@ -4,10 +4,18 @@ This module provides helper functions used throughout the converter library
 for platform checks, file validation, and directory scanning.
 """
 
+import errno
+import mmap
+import os
 import platform
 import shutil
-from pathlib import Path
-from typing import List, Optional
+import stat
+import struct
+import sys
+import tempfile
+from functools import lru_cache
+from pathlib import Path, PurePath, PureWindowsPath
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from .exceptions import (
     PlatformNotSupportedError,
@@ -15,6 +23,9 @@ from .exceptions import (
     FileValidationError,
 )
 
+# Keyword arguments for @dataclass: slotted instances where supported (3.10+)
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 EVT_SIGNATURE_OFFSET = 0x04
 EVT_SIGNATURE = b"LfLe"
 
@@ -24,6 +35,26 @@ EVT_FLAGS_OFFSET = 0x24  # Offset to flags field in EVT header
 EVT_FLAG_DIRTY = 0x01  # File not properly closed (copied from live system)
 EVT_FLAG_WRAP = 0x02  # Log has wrapped
 
+# A little-endian DWORD header field
+_UINT32_STRUCT = struct.Struct("<I")
+
+# EOF record signature: 0x11111111 0x22222222 0x33333333 0x44444444
+_EVT_EOF_SIGNATURE = bytes.fromhex("11111111222222223333333344444444")
+
+# Read size used when scanning a file for the EOF record (see repair_dirty_evt())
+_REPAIR_SCAN_CHUNK_SIZE = 1 << 20
+
+# os.copy_file_range() errors that mean "copy another way" (see _copy_file_contents())
+_COPY_FILE_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EPERM}
+)
+
+# Buffer size for copies the kernel can't do itself (see _copy_file_contents())
+_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+# How much of the end of an unwrapped log is searched for its EOF record first
+_REPAIR_TAIL_SIZE = 64 * 1024
+
 
 def validate_legacy_evt_signature(input_file: Path) -> None:
     """Validate that a file looks like a legacy Windows Event Log (.evt).
@@ -38,11 +69,28 @@ def validate_legacy_evt_signature(input_file: Path) -> None:
         FileValidationError: If the signature is missing or the file is too small.
     """
     try:
-        with input_file.open("rb") as f:
-            header = f.read(EVT_SIGNATURE_OFFSET + len(EVT_SIGNATURE))
+        header = _read_evt_header(input_file)
     except OSError as e:
         raise FileValidationError(f"Cannot read input file: {input_file} ({e})")
 
+    _check_legacy_evt_signature(input_file, header)
+
+
+def _read_evt_header(input_file: Path) -> bytes:
+    """Read the fixed-size EVT header (or less, if the file is shorter).
+
+    Uses a bare file descriptor, so the header costs a single read() call and
+    no file object or buffer is created.
+    """
+    fd = os.open(input_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        return os.read(fd, EVT_HEADER_SIZE)
+    finally:
+        os.close(fd)
+
+
+def _check_legacy_evt_signature(input_file: Path, header: bytes) -> None:
+    """Check the signature in an already-read header (see above)."""
     if len(header) < EVT_SIGNATURE_OFFSET + len(EVT_SIGNATURE):
         raise FileValidationError(
             f"Input file is too small to be a valid legacy .evt: {input_file}"
@@ -59,11 +107,30 @@ def validate_legacy_evt_signature(input_file: Path) -> None:
         )
 
 
+@lru_cache(maxsize=None)
+def _platform_system() -> str:
+    """Return platform.system(); it can't change while the process runs."""
+    return platform.system()
+
+
+@lru_cache(maxsize=None)
+def _wevtutil_path() -> Optional[str]:
+    """Return the location of wevtutil on PATH, or None if it is missing."""
+    return shutil.which("wevtutil")
+
+
+def _reset_check_caches() -> None:
+    """Forget cached platform and wevtutil lookups (used by tests)."""
+    _platform_system.cache_clear()
+    _wevtutil_path.cache_clear()
+
+
 def check_platform() -> None:
     """Verify that the current platform is Windows.
 
     The EVT to EVTX conversion requires the Windows-native wevtutil tool,
     so this function ensures the code is running on a Windows system.
+    The platform is looked up once per process.
 
     Raises:
         PlatformNotSupportedError: If the current platform is not Windows.
@@ -72,7 +139,7 @@ def check_platform() -> None:
         >>> check_platform()  # On Windows - no exception
         >>> check_platform()  # On Linux - raises PlatformNotSupportedError
     """
-    current_platform = platform.system()
+    current_platform = _platform_system()
     if current_platform != "Windows":
         raise PlatformNotSupportedError(current_platform)
 
@@ -81,7 +148,8 @@ def check_wevtutil_available() -> None:
     """Verify that the wevtutil command-line tool is available.
 
     Uses shutil.which() to check if wevtutil is in the system PATH
-    and can be executed.
+    and can be executed. A successful lookup is cached for the rest of the
+    process, so repeated calls are cheap.
 
     Raises:
         WevtutilNotFoundError: If wevtutil cannot be found in the system PATH.
@@ -90,7 +158,9 @@ def check_wevtutil_available() -> None:
         >>> check_wevtutil_available()  # On Windows with wevtutil - no exception
         >>> check_wevtutil_available()  # Without wevtutil - raises WevtutilNotFoundError
     """
-    if shutil.which("wevtutil") is None:
+    if _wevtutil_path() is None:
+        # Don't remember a miss; wevtutil may be added to PATH later
+        _wevtutil_path.cache_clear()
         raise WevtutilNotFoundError()
 
 
@@ -120,32 +190,68 @@ def validate_evt_file(
         >>> validate_evt_file(Path("missing.evt"))  # Raises FileValidationError
         >>> validate_evt_file(Path("System.txt"))  # Raises FileValidationError (wrong extension)
     """
+    _validate_evt_file(input_file, output_file)
+
+
+def _validate_evt_file(
+    input_file: Path, output_file: Optional[Path] = None
+) -> Tuple[bool, bytes]:
+    """Run the validate_evt_file() checks without repeating any I/O.
+
+    Each path is stat'ed at most once and the input header is read once.
+
+    Returns:
+        Whether output_file already exists, and the input file's header bytes
+        so callers can inspect its flags (see _is_dirty_header()).
+    """
     # Check if input file exists
-    if not input_file.exists():
+    try:
+        input_stat = input_file.stat()
+    except (FileNotFoundError, NotADirectoryError):
         raise FileValidationError(f"Input file does not exist: {input_file}")
 
     # Check if input is a file (not a directory)
-    if not input_file.is_file():
+    if not stat.S_ISREG(input_stat.st_mode):
         raise FileValidationError(f"Input path is not a file: {input_file}")
 
     # Check if input file has .evt extension
-    if input_file.suffix.lower() != ".evt":
+    if not _has_evt_suffix(input_file.name):
         raise FileValidationError(
             f"Input file must have .evt extension. Got: {input_file.suffix}"
         )
 
-    validate_legacy_evt_signature(input_file)
+    try:
+        header = _read_evt_header(input_file)
+    except OSError as e:
+        raise FileValidationError(f"Cannot read input file: {input_file} ({e})")
+    _check_legacy_evt_signature(input_file, header)
 
     # Check output file if specified
-    if output_file is not None:
+    if output_file is None:
+        return False, header
+
+    try:
+        output_stat = output_file.stat()
+    except (FileNotFoundError, NotADirectoryError):
         # Ensure parent directory exists (wevtutil won't create it)
         if not output_file.parent.exists():
             raise FileValidationError(
                 f"Output directory does not exist: {output_file.parent}"
             )
+        return False, header
+
+    if stat.S_ISDIR(output_stat.st_mode):
+        raise FileValidationError(f"Output path is a directory: {output_file}")
+    return True, header
+
 
-        if output_file.exists() and output_file.is_dir():
-            raise FileValidationError(f"Output path is a directory: {output_file}")
+def _has_evt_suffix(name: str) -> bool:
+    """Check for a case-insensitive .evt suffix on a file name.
+
+    Equivalent to ``Path(name).suffix.lower() == ".evt"`` without building a
+    Path; a bare ".evt" is a hidden file with no suffix.
+    """
+    return len(name) > 4 and name[-4:].lower() == ".evt"
 
 
 def generate_output_path(input_file: Path, output_dir: Optional[Path] = None) -> Path:
@@ -178,6 +284,64 @@ def generate_output_path(input_file: Path, output_dir: Optional[Path] = None) ->
         return input_file.parent / output_filename
 
 
+def iter_evt_files(directory: Path, recursive: bool = False) -> Iterator[Path]:
+    """Iterate over .evt files in a directory as they are discovered.
+
+    Unlike find_evt_files(), paths are yielded while the directory tree is
+    still being scanned and are not sorted, so callers can start working on the
+    first file before a large tree has been fully traversed.
+
+    Args:
+        directory: Path to the directory to search.
+        recursive: If True, search subdirectories recursively.
+                  If False, only search the immediate directory.
+
+    Returns:
+        Iterator of Path objects for the .evt files found, in discovery order.
+
+    Raises:
+        FileValidationError: If the directory does not exist or is not a directory.
+    """
+    _check_search_directory(directory)
+    return (Path(entry.path) for entry in _scan_evt_entries(directory, recursive))
+
+
+def _check_search_directory(directory: Path) -> None:
+    """Raise FileValidationError unless directory is an existing directory."""
+    if not directory.exists():
+        raise FileValidationError(f"Directory does not exist: {directory}")
+
+    if not directory.is_dir():
+        raise FileValidationError(f"Path is not a directory: {directory}")
+
+
+def _scan_evt_entries(directory: Path, recursive: bool) -> Iterator["os.DirEntry[str]"]:
+    """Yield directory entries for the .evt files under directory.
+
+    Walks with os.scandir(), whose entries usually carry their file type, so
+    no stat() is needed per entry and callers only build Paths for matches. The
+    suffix is matched case-insensitively, like the validation does (a
+    ".EVT" file is found on every platform). Symlinked directories aren't
+    followed, and unreadable directories are skipped.
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            scanner = os.scandir(pending.pop())
+        except OSError:
+            continue
+        with scanner:
+            for entry in scanner:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if recursive:
+                            pending.append(entry.path)
+                    elif _has_evt_suffix(entry.name) and entry.is_file():
+                        yield entry
+                except OSError:
+                    continue
+
+
 def find_evt_files(directory: Path, recursive: bool = False) -> List[Path]:
     """Find all .evt files in a directory.
 
@@ -201,23 +365,55 @@ def find_evt_files(directory: Path, recursive: bool = False) -> List[Path]:
         >>> find_evt_files(Path("C:/Logs"), recursive=True)
         [Path("C:/Logs/Application.evt"), Path("C:/Logs/Archive/Old.evt"), ...]
     """
-    # Validate directory
-    if not directory.exists():
-        raise FileValidationError(f"Directory does not exist: {directory}")
+    return sorted(iter_evt_files(directory, recursive=recursive), key=_path_sort_key)
 
-    if not directory.is_dir():
-        raise FileValidationError(f"Path is not a directory: {directory}")
 
-    # Find .evt files
-    if recursive:
-        pattern = "**/*.evt"
-    else:
-        pattern = "*.evt"
+def find_evt_files_with_size(
+    directory: Path, recursive: bool = False
+) -> List[Tuple[Path, int]]:
+    """Find all .evt files in a directory, with their sizes in bytes.
 
-    # Use glob to find files and sort them
-    evt_files = sorted(directory.glob(pattern))
+    Like find_evt_files(), but the sizes come from the directory scan's
+    entries: on Windows the directory listing already includes them, so no
+    file is stat'ed separately. Files that vanish during the scan are left out.
 
-    return evt_files
+    Args:
+        directory: Path to the directory to search.
+        recursive: If True, search subdirectories recursively.
+                  If False, only search the immediate directory.
+
+    Returns:
+        List of (path, size) tuples, sorted by path like find_evt_files().
+
+    Raises:
+        FileValidationError: If the directory does not exist or is not a directory.
+
+    Example:
+        >>> find_evt_files_with_size(Path("C:/Logs"))
+        [(Path("C:/Logs/Application.evt"), 69632), (Path("C:/Logs/System.evt"), 65536)]
+    """
+    _check_search_directory(directory)
+    found = []
+    for entry in _scan_evt_entries(directory, recursive):
+        try:
+            size = entry.stat().st_size
+        except OSError:
+            continue
+        found.append((Path(entry.path), size))
+    found.sort(key=lambda item: _path_sort_key(item[0]))
+    return found
+
+
+def _path_sort_key(path: PurePath) -> Tuple[str, ...]:
+    """Return a key that sorts paths the way Path's own ordering does.
+
+    Comparing the keys' tuples stays in C, whereas sorting Paths directly
+    calls PurePath.__lt__ for every comparison. Windows paths compare
+    case-insensitively.
+    """
+    if isinstance(path, PureWindowsPath):
+        return tuple(part.lower() for part in path.parts)
+    return path.parts
 
 
 def is_evt_dirty(input_file: Path) -> bool:
@@ -235,113 +431,94 @@ def is_evt_dirty(input_file: Path) -> bool:
     Raises:
         FileValidationError: If the file cannot be read or is too small.
     """
-    from .exceptions import FileValidationError
-
     try:
-        with input_file.open("rb") as f:
-            f.seek(EVT_FLAGS_OFFSET)
-            flags_bytes = f.read(4)
+        header = _read_evt_header(input_file)
     except OSError as e:
         raise FileValidationError(f"Cannot read EVT flags: {input_file} ({e})")
 
-    if len(flags_bytes) < 4:
+    return _is_dirty_header(input_file, header)
+
+
+def _is_dirty_header(input_file: Path, header: bytes) -> bool:
+    """Check the DIRTY flag in an already-read header (see is_evt_dirty())."""
+    if len(header) < EVT_FLAGS_OFFSET + 4:
         raise FileValidationError(
             f"File too small to contain flags field: {input_file}"
         )
 
-    flags = int.from_bytes(flags_bytes, byteorder="little")
+    flags = int.from_bytes(
+        header[EVT_FLAGS_OFFSET : EVT_FLAGS_OFFSET + 4], byteorder="little"
+    )
     return bool(flags & EVT_FLAG_DIRTY)
 
 
-def repair_dirty_evt(input_file: Path, output_file: Optional[Path] = None) -> Path:
+def repair_dirty_evt(
+    input_file: Path,
+    output_file: Optional[Path] = None,
+    temp_dir: Optional[Path] = None,
+    in_place: bool = False,
+) -> Path:
     """Create a repaired copy of a dirty EVT file with the DIRTY flag cleared.
 
     EVT files copied from running Windows systems have the DIRTY flag set,
     which causes wevtutil to reject them. This function creates a copy with
     the flag cleared and the end_offset corrected, preserving the original file.
 
+    Only the header of the copy is rewritten; the EOF record is located by
+    searching a memory map of the copy, so the file is never held in memory.
+
     Args:
         input_file: Path to the dirty EVT file.
-        output_file: Path for the repaired copy. If None, creates a temp file
-                    in the same directory with a .tmp extension.
+        output_file: Path for the repaired copy, which keeps input_file's
+                    timestamps and mode. If None, creates a temp file with a
+                    .evt.tmp extension in temp_dir.
+        temp_dir: Directory for the temp file when output_file is None.
+                 Defaults to the system temp directory, which is usually
+                 faster than the (often slow or remote) source directory.
+        in_place: If True, patch input_file's header directly instead of
+                 copying it, which avoids copying a large log. Only use this
+                 on a file you own (e.g. an already-made copy), since the
+                 original header is lost. output_file and temp_dir must not
+                 be given.
 
     Returns:
-        Path to the repaired file.
+        Path to the repaired file (input_file when in_place is True).
 
     Raises:
         FileValidationError: If the file cannot be read or written.
+        ValueError: If in_place is combined with output_file or temp_dir.
     """
-    import shutil
-    import tempfile
-    import os
-    from .exceptions import FileValidationError
-
-    # EOF record signature: 0x11111111 0x22222222 0x33333333 0x44444444
-    EOF_SIGNATURE = bytes.fromhex("11111111222222223333333344444444")
-    EOF_RECORD_SIZE = 40  # Size of the EOF record
-    END_OFFSET_LOCATION = 0x14  # Offset to end_offset field in header
-    CURRENT_RECORD_LOCATION = 0x18  # Offset to current record number in header
-    OLDEST_RECORD_LOCATION = 0x1C  # Offset to oldest record number in header
+    if in_place:
+        if output_file is not None or temp_dir is not None:
+            raise ValueError("in_place repair does not take output_file or temp_dir")
+        try:
+            with input_file.open("r+b") as f:
+                _repair_evt_header(f)
+        except OSError as e:
+            raise FileValidationError(f"Failed to repair EVT file: {input_file} ({e})")
+        return input_file
 
     # Determine output path
+    keep_metadata = output_file is not None
     if output_file is None:
-        # Create temp file in same directory to avoid cross-device issues
         fd, temp_path = tempfile.mkstemp(
             suffix=".evt.tmp",
             prefix=input_file.stem + "_repaired_",
-            dir=input_file.parent,
+            dir=temp_dir,
         )
         os.close(fd)
         output_file = Path(temp_path)
 
     try:
-        # Copy the entire file first
-        shutil.copy2(input_file, output_file)
+        # Copy the file contents (metadata isn't needed for a temp copy)
+        _copy_file_contents(input_file, output_file)
 
         with output_file.open("r+b") as f:
-            # Read entire file to find EOF record
-            f.seek(0)
-            content = f.read()
-
-            # Find EOF signature (starts 4 bytes into EOF record, after size field)
-            eof_sig_pos = content.find(EOF_SIGNATURE)
-
-            # Clear the DIRTY flag (bit 0)
-            f.seek(EVT_FLAGS_OFFSET)
-            flags_bytes = f.read(4)
-            flags = int.from_bytes(flags_bytes, byteorder="little")
-            new_flags = flags & ~EVT_FLAG_DIRTY
-            f.seek(EVT_FLAGS_OFFSET)
-            f.write(new_flags.to_bytes(4, byteorder="little"))
-
-            # Fix header fields using EOF record data if found
-            if eof_sig_pos >= 0:
-                # EOF record starts 4 bytes before signature (size field)
-                eof_record_start = eof_sig_pos - 4
-                # end_offset should point to after the EOF record
-                correct_end_offset = eof_record_start + EOF_RECORD_SIZE
-
-                # Read current and oldest record numbers from EOF record
-                # EOF record layout after signature: begin(4), end(4), current(4), oldest(4), size(4)
-                # Offsets from signature start: +16=begin, +20=end, +24=current, +28=oldest
-                eof_current_record = int.from_bytes(
-                    content[eof_sig_pos + 24 : eof_sig_pos + 28], "little"
-                )
-                eof_oldest_record = int.from_bytes(
-                    content[eof_sig_pos + 28 : eof_sig_pos + 32], "little"
-                )
-
-                # Update end_offset in header
-                f.seek(END_OFFSET_LOCATION)
-                f.write(correct_end_offset.to_bytes(4, byteorder="little"))
-
-                # Sync current record number with EOF record
-                f.seek(CURRENT_RECORD_LOCATION)
-                f.write(eof_current_record.to_bytes(4, byteorder="little"))
-
-                # Sync oldest record number with EOF record
-                f.seek(OLDEST_RECORD_LOCATION)
-                f.write(eof_oldest_record.to_bytes(4, byteorder="little"))
+            _repair_evt_header(f)
+
+        # A caller-supplied copy keeps the original's timestamps and mode
+        if keep_metadata:
+            shutil.copystat(input_file, output_file)
 
         return output_file
 
@@ -350,3 +527,133 @@ def repair_dirty_evt(input_file: Path, output_file: Optional[Path] = None) -> Pa
         if output_file.exists():
             output_file.unlink()
         raise FileValidationError(f"Failed to repair EVT file: {input_file} ({e})")
+
+
+def _copy_file_contents(source: Path, target: Path) -> None:
+    """Copy source's contents to target, like shutil.copyfile().
+
+    Uses os.copy_file_range() where available (Linux), which lets
+    copy-on-write filesystems such as Btrfs and XFS clone the file's extents
+    instead of copying its bytes. Otherwise Linux and macOS copy in the
+    kernel through shutil.copyfile(); elsewhere the file is copied through a
+    _COPY_BUFFER_SIZE buffer, well above shutil's default.
+    """
+    if target.exists() and os.path.samefile(source, target):
+        raise shutil.SameFileError(f"{source!r} and {target!r} are the same file")
+
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            with source.open("rb") as src, target.open("wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if not copied:
+                        break
+                    remaining -= copied
+            return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+
+    if sys.platform.startswith("linux") or sys.platform == "darwin":
+        # sendfile() / fcopyfile()
+        shutil.copyfile(source, target)
+        return
+
+    with source.open("rb") as src, target.open("wb") as dst:
+        shutil.copyfileobj(src, dst, _COPY_BUFFER_SIZE)
+
+
+def _repair_evt_header(f: BinaryIO) -> None:
+    """Clear the DIRTY flag and fix the header of an EVT file open for update.
+
+    The header fields are patched in a copy of the header and written back
+    with a single write. See repair_dirty_evt().
+    """
+    EOF_RECORD_SIZE = 40  # Size of the EOF record
+    END_OFFSET_LOCATION = 0x14  # Offset to end_offset field in header
+    CURRENT_RECORD_LOCATION = 0x18  # Offset to current record number in header
+
+    f.seek(0)
+    header = bytearray(f.read(EVT_HEADER_SIZE).ljust(EVT_HEADER_SIZE, b"\x00"))
+    (flags,) = _UINT32_STRUCT.unpack_from(header, EVT_FLAGS_OFFSET)
+
+    # Find EOF signature (starts 4 bytes into EOF record, after size field).
+    # A log that hasn't wrapped ends with its only EOF record, so look
+    # at the tail first; a wrapped log's EOF record can be anywhere.
+    eof_sig_pos = -1
+    if not flags & EVT_FLAG_WRAP:
+        eof_sig_pos = _find_in_tail(f, _EVT_EOF_SIGNATURE)
+    if eof_sig_pos < 0:
+        eof_sig_pos = _find_in_file(f, _EVT_EOF_SIGNATURE)
+
+    # Clear the DIRTY flag (bit 0)
+    _UINT32_STRUCT.pack_into(header, EVT_FLAGS_OFFSET, flags & ~EVT_FLAG_DIRTY)
+
+    # Fix header fields using EOF record data if found
+    if eof_sig_pos >= 0:
+        # EOF record starts 4 bytes before signature (size field)
+        eof_record_start = eof_sig_pos - 4
+        # end_offset should point to after the EOF record
+        correct_end_offset = eof_record_start + EOF_RECORD_SIZE
+
+        # Read current and oldest record numbers from EOF record
+        # EOF record layout after signature: begin(4), end(4), current(4), oldest(4), size(4)
+        # Offsets from signature start: +16=begin, +20=end, +24=current, +28=oldest
+        f.seek(eof_sig_pos + 24)
+        eof_records = f.read(8).ljust(8, b"\x00")
+
+        # Update end_offset in header, then sync the current and oldest
+        # record numbers (adjacent fields) with the EOF record
+        _UINT32_STRUCT.pack_into(header, END_OFFSET_LOCATION, correct_end_offset)
+        header[CURRENT_RECORD_LOCATION : CURRENT_RECORD_LOCATION + 8] = eof_records
+
+    # Every patched field lies between end_offset and the end of flags
+    f.seek(END_OFFSET_LOCATION)
+    f.write(header[END_OFFSET_LOCATION : EVT_FLAGS_OFFSET + 4])
+
+
+def _find_in_tail(f: BinaryIO, needle: bytes) -> int:
+    """Return the offset of the last needle in f's final _REPAIR_TAIL_SIZE bytes.
+
+    Returns -1 if it isn't there (see _find_in_file() for a full scan).
+    """
+    size = f.seek(0, 2)
+    tail_start = max(0, size - _REPAIR_TAIL_SIZE)
+    f.seek(tail_start)
+    pos = f.read().rfind(needle)
+    return tail_start + pos if pos >= 0 else -1
+
+
+def _find_in_file(f: BinaryIO, needle: bytes) -> int:
+    """Return the offset of the first occurrence of needle in f, or -1.
+
+    The file is memory-mapped and searched in place, so only the pages up to
+    the match are read and nothing is copied. Files that can't be mapped are
+    read in _REPAIR_SCAN_CHUNK_SIZE chunks instead, keeping enough of the
+    previous chunk to find a match that straddles two reads.
+    """
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                # The search reads front to back; let the kernel read ahead
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            return mapped.find(needle)
+    except (OSError, ValueError):
+        pass  # Empty or unmappable file
+
+    f.seek(0)
+    offset = 0  # File offset of the start of buffer
+    buffer = b""
+    while True:
+        chunk = f.read(_REPAIR_SCAN_CHUNK_SIZE)
+        if not chunk:
+            return -1
+        buffer += chunk
+        pos = buffer.find(needle)
+        if pos >= 0:
+            return offset + pos
+        keep = min(len(needle) - 1, len(buffer))
+        offset += len(buffer) - keep
+        buffer = buffer[-keep:]
@@ -1,6 +1,12 @@
+import json
+import shutil
+from pathlib import Path
+from typing import Optional
+
 import pytest
 
-from evt_parser.cli import main
+from evt_parser import cli, utils
+from evt_parser.cli import ProgressBar, main
 
 
 def test_cli_help_exits_zero() -> None:
@@ -13,3 +19,113 @@ def test_cli_version_exits_zero() -> None:
     with pytest.raises(SystemExit) as excinfo:
         main(["--version"])
     assert excinfo.value.code == 0
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_parse_batch_writes_one_output_per_file(tmp_path: Path, jobs: str) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("Application.evt", "System.evt"):
+        shutil.copy(Path("test_files") / name, src / name)
+    out = tmp_path / "out"
+
+    code = main(["parse", "--batch", str(src), "-O", str(out), "-j", jobs, "-q"])
+
+    assert code == 0
+    assert sorted(p.name for p in out.iterdir()) == ["Application.json", "System.json"]
+    assert json.loads((out / "System.json").read_text(encoding="utf-8"))["records"]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_parse_batch_recursive_mirrors_source_tree(
+    tmp_path: Path, jobs: str
+) -> None:
+    src = tmp_path / "src"
+    for rel in ("System.evt", "sub/System.evt"):
+        (src / rel).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copy(Path("test_files") / "System.evt", src / rel)
+    out = tmp_path / "out"
+
+    code = main(["parse", "--batch", str(src), "-r", "-O", str(out), "-j", jobs, "-q"])
+
+    assert code == 0
+    assert (out / "System.json").exists()
+    assert (out / "sub" / "System.json").exists()
+
+
+def test_cli_parse_batch_single_worker_parses_in_sorted_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    names = ["b.evt", "A.evt", "c.evt"]
+    monkeypatch.setattr(
+        utils, "iter_evt_files", lambda *a, **k: iter(tmp_path / n for n in names)
+    )
+    parsed = []
+
+    def fake_parse_and_write(evt_file, *args):
+        parsed.append(evt_file.name)
+        return 1
+
+    monkeypatch.setattr(cli, "_parse_and_write", fake_parse_and_write)
+
+    assert main(["parse", "--batch", str(tmp_path), "-j", "1", "-q"]) == 0
+    assert parsed == ["A.evt", "b.evt", "c.evt"]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_cli_parse_batch_counts_non_evt_files_as_failed(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], jobs: str
+) -> None:
+    shutil.copy(Path("test_files") / "System.evt", tmp_path / "System.evt")
+    (tmp_path / "notes.evt").write_text("not an event log", encoding="utf-8")
+
+    code = main(["parse", "--batch", str(tmp_path), "-j", jobs, "-q"])
+
+    assert code == 2
+    assert (tmp_path / "System.json").exists()
+    assert not (tmp_path / "notes.json").exists()
+    assert "Total files found:       2" in capsys.readouterr().out
+
+
+def test_cli_parse_rejects_non_positive_jobs(tmp_path: Path) -> None:
+    assert main(["parse", "--batch", str(tmp_path), "-j", "0"]) == 1
+
+
+@pytest.mark.parametrize(
+    "platform, cpus, expected",
+    [("win32", 64, 61), ("linux", 64, 64), ("win32", None, 1)],
+)
+def test_default_parse_workers_respects_windows_limit(
+    monkeypatch: pytest.MonkeyPatch, platform: str, cpus: Optional[int], expected: int
+) -> None:
+    monkeypatch.setattr(cli.sys, "platform", platform)
+    monkeypatch.setattr(cli.os, "cpu_count", lambda: cpus)
+    assert cli._default_parse_workers() == expected
+
+
+def test_cli_parse_rejects_jobs_above_windows_limit(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(cli.sys, "platform", "win32")
+    assert main(["parse", "--batch", str(tmp_path), "-j", "62"]) == 1
+    assert "at most 61" in capsys.readouterr().err
+
+
+def test_progress_bar_throttles_intermediate_updates(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    bar = ProgressBar(min_interval=3600)
+    for i in range(1, 4):
+        bar.update(i, 3, Path(f"file{i}.evt"))
+
+    err = capsys.readouterr().err
+    assert "file1.evt" in err
+    assert "file2.evt" not in err
+    assert err.endswith("(3/3) file3.evt\n")
+
+
+def test_progress_bar_renders_percentage_with_one_decimal(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    ProgressBar(width=3).update(2, 3, Path("a.evt"))
+    assert capsys.readouterr().err == "\r[==-] 66.7% (2/3) a.evt"
@@ -1,10 +1,13 @@
+import asyncio
 import subprocess
+import sys
 from pathlib import Path
+from typing import Optional
 
 import pytest
 
 import evt_parser.converter as converter
-from evt_parser.converter import ConversionStatus, convert_evt_to_evtx
+from evt_parser.converter import ConversionStatus, batch_convert, convert_evt_to_evtx
 
 
 def test_convert_returns_skipped_when_output_exists(
@@ -22,19 +25,49 @@ def test_convert_returns_skipped_when_output_exists(
     assert result.status == ConversionStatus.SKIPPED
 
 
-def test_convert_builds_wevtutil_command_and_writes_output(
+def test_convert_skips_existing_output_without_validating_input(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     input_evt = tmp_path / "in.evt"
     input_evt.write_bytes(b"\x00\x00\x00\x00LfLe")
     output_evtx = tmp_path / "out.evtx"
+    output_evtx.write_bytes(b"existing")
+
+    def fail_validation(*args: object) -> None:
+        raise AssertionError("input should not be validated")
 
     monkeypatch.setattr(converter, "check_platform", lambda: None)
     monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+    monkeypatch.setattr(converter, "_validate_evt_file", fail_validation)
+
+    result = convert_evt_to_evtx(input_evt, output_evtx, overwrite=False)
+    assert result.status == ConversionStatus.SKIPPED
+
+
+@pytest.mark.parametrize(
+    "found, program",
+    [
+        (None, "wevtutil"),
+        ("C:\\Windows\\System32\\wevtutil.EXE", "C:\\Windows\\System32\\wevtutil.EXE"),
+    ],
+)
+def test_convert_builds_wevtutil_command_and_writes_output(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    found: Optional[str],
+    program: str,
+) -> None:
+    input_evt = tmp_path / "in.evt"
+    input_evt.write_bytes(b"\x00\x00\x00\x00LfLe")
+    output_evtx = tmp_path / "out.evtx"
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+    monkeypatch.setattr(converter, "_wevtutil_path", lambda: found)
 
     captured = {}
 
-    def fake_run(command, capture_output, text, timeout, check):
+    def fake_run(command, **kwargs):
         captured["command"] = command
         output_evtx.write_bytes(b"evtx")
         return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
@@ -45,5 +78,247 @@ def test_convert_builds_wevtutil_command_and_writes_output(
     assert result.status == ConversionStatus.SUCCESS
     assert result.output_file == output_evtx
     assert output_evtx.exists()
-    assert captured["command"][0:3] == ["wevtutil", "epl", str(input_evt.absolute())]
+    assert captured["command"][0:3] == (program, "epl", str(input_evt.absolute()))
     assert captured["command"][-1] == "/lf:true"
+
+
+def test_convert_reports_wevtutil_stderr_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    input_evt = tmp_path / "in.evt"
+    input_evt.write_bytes(b"\x00\x00\x00\x00LfLe")
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+
+    def fake_run(command, **kwargs):
+        assert kwargs["stdout"] == subprocess.DEVNULL
+        raise subprocess.CalledProcessError(5, command, stderr=b"Access is denied.\r\n")
+
+    monkeypatch.setattr(converter.subprocess, "run", fake_run)
+
+    result = convert_evt_to_evtx(input_evt, tmp_path / "out.evtx")
+    assert result.status == ConversionStatus.FAILED
+    assert result.error_message == (
+        "wevtutil failed with return code 5: Access is denied."
+    )
+
+
+@pytest.mark.parametrize("max_workers", [1, 3])
+def test_batch_convert_keeps_results_in_input_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, max_workers: int
+) -> None:
+    names = ["a", "b", "c", "d"]
+    for name in names:
+        (tmp_path / f"{name}.evt").write_bytes(b"\x00\x00\x00\x00LfLe")
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+
+    def fake_run(command, **kwargs):
+        Path(command[3]).write_bytes(b"evtx")
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(converter.subprocess, "run", fake_run)
+
+    progress = []
+    summary = batch_convert(
+        tmp_path,
+        max_workers=max_workers,
+        progress_callback=lambda current, total, _: progress.append((current, total)),
+    )
+
+    assert summary.successful == len(names)
+    assert [r.input_file.stem for r in summary.results] == names
+    assert progress == [(i, len(names)) for i in range(1, len(names) + 1)]
+
+
+def test_batch_convert_without_collect_results_keeps_only_failures(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ["a", "b", "c"]:
+        (tmp_path / f"{name}.evt").write_bytes(b"\x00\x00\x00\x00LfLe")
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+
+    def fake_run(command, **kwargs):
+        if Path(command[2]).stem == "b":
+            raise subprocess.CalledProcessError(1, command, stderr=b"")
+        Path(command[3]).write_bytes(b"evtx")
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(converter.subprocess, "run", fake_run)
+
+    summary = batch_convert(tmp_path, max_workers=1, collect_results=False)
+
+    assert (summary.total, summary.successful, summary.failed) == (3, 2, 1)
+    assert [r.input_file.stem for r in summary.results] == ["b"]
+
+
+@pytest.mark.parametrize("cpus, expected", [(None, 1), (4, 4), (64, 8)])
+def test_default_max_workers_is_cpu_count_capped(
+    monkeypatch: pytest.MonkeyPatch, cpus: Optional[int], expected: int
+) -> None:
+    monkeypatch.setattr(converter.os, "cpu_count", lambda: cpus)
+    assert converter._default_max_workers() == expected
+
+
+def test_batch_convert_manifest_skips_unchanged_inputs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    for name in ["a", "b"]:
+        (tmp_path / f"{name}.evt").write_bytes(b"\x00\x00\x00\x00LfLe")
+    manifest = tmp_path / converter.MANIFEST_FILENAME
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+
+    def fake_run(command, **kwargs):
+        Path(command[3]).write_bytes(b"evtx")
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(converter.subprocess, "run", fake_run)
+
+    first = batch_convert(tmp_path, manifest_file=manifest)
+    assert first.successful == 2
+    assert manifest.exists()
+
+    (tmp_path / "b.evt").write_bytes(b"\x00\x00\x00\x00LfLe\x00")
+
+    calls = []
+
+    def fake_convert(evt_file, output_file, overwrite, *args, **kwargs):
+        calls.append((evt_file.name, overwrite))
+        return converter.ConversionResult(ConversionStatus.SUCCESS, evt_file)
+
+    monkeypatch.setattr(converter, "_convert_file", fake_convert)
+
+    # The changed input replaces its stale output
+    second = batch_convert(tmp_path, manifest_file=manifest)
+    assert calls == [("b.evt", True)]
+    assert [r.status for r in second.results] == [
+        ConversionStatus.SKIPPED,
+        ConversionStatus.SUCCESS,
+    ]
+
+    # A recorded success doesn't cover a different output directory
+    calls.clear()
+    third = batch_convert(tmp_path, tmp_path / "out", manifest_file=manifest)
+    assert calls == [("a.evt", False), ("b.evt", False)]
+    assert third.successful == 2
+
+
+def test_batch_convert_recursive_mirrors_source_tree(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    src = tmp_path / "src"
+    for rel in ["a.evt", "sub/b.evt", "sub/c.evt"]:
+        (src / rel).parent.mkdir(parents=True, exist_ok=True)
+        (src / rel).write_bytes(b"\x00\x00\x00\x00LfLe")
+    out = tmp_path / "out"
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+
+    def fake_run(command, **kwargs):
+        Path(command[3]).write_bytes(b"evtx")
+        return subprocess.CompletedProcess(command, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(converter.subprocess, "run", fake_run)
+
+    summary = batch_convert(src, out, recursive=True)
+
+    assert summary.successful == 3
+    assert sorted(p.relative_to(out).as_posix() for p in out.rglob("*.evtx")) == [
+        "a.evtx",
+        "sub/b.evtx",
+        "sub/c.evtx",
+    ]
+
+
+def test_abatch_convert_runs_subprocesses_and_keeps_input_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    names = ["a", "b", "c"]
+    for name in names:
+        (tmp_path / f"{name}.evt").write_bytes(b"\x00\x00\x00\x00LfLe")
+    (tmp_path / "b.evtx").write_bytes(b"existing")
+
+    monkeypatch.setattr(converter, "check_platform", lambda: None)
+    monkeypatch.setattr(converter, "check_wevtutil_available", lambda: None)
+    # Stand in for wevtutil with a child process that copies the input
+    monkeypatch.setattr(
+        converter,
+        "_wevtutil_command",
+        lambda source, target, cwd=None: [
+            sys.executable,
+            "-c",
+            "import shutil, sys; shutil.copyfile(sys.argv[1], sys.argv[2])",
+            str(source),
+            str(target),
+        ],
+    )
+
+    summary = asyncio.run(converter.abatch_convert(tmp_path, max_workers=2))
+
+    assert [r.input_file.stem for r in summary.results] == names
+    assert [r.status for r in summary.results] == [
+        ConversionStatus.SUCCESS,
+        ConversionStatus.SKIPPED,
+        ConversionStatus.SUCCESS,
+    ]
+    assert (tmp_path / "a.evtx").read_bytes() == b"\x00\x00\x00\x00LfLe"
+
+
+def test_aconvert_reaps_wevtutil_after_killing_it_on_timeout(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = []
+
+    class HangingProcess:
+        returncode: Optional[int] = None
+
+        async def communicate(self) -> None:
+            await asyncio.Event().wait()
+
+        def kill(self) -> None:
+            calls.append("kill")
+
+        async def wait(self) -> int:
+            calls.append("wait")
+            self.returncode = -9
+            return self.returncode
+
+    async def fake_exec(*args, **kwargs):
+        return HangingProcess()
+
+    evt_file = tmp_path / "a.evt"
+    monkeypatch.setattr(
+        converter, "_prepare_conversion", lambda *args: (evt_file, None)
+    )
+    monkeypatch.setattr(converter.asyncio, "create_subprocess_exec", fake_exec)
+
+    result = asyncio.run(
+        converter._aconvert_evt_to_evtx(evt_file, tmp_path / "a.evtx", False, 0, False)
+    )
+
+    assert result.status is ConversionStatus.FAILED
+    assert "timed out" in (result.error_message or "")
+    assert calls == ["kill", "wait"]
+
+
+def test_async_cleanup_deletes_temp_files_on_drain(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(converter, "_ASYNC_CLEANUP", True)
+    temp_files = [tmp_path / f"{i}.evt.tmp" for i in range(3)]
+    for temp_file in temp_files:
+        temp_file.write_bytes(b"copy")
+
+    for temp_file in temp_files:
+        converter._remove_temp_file(temp_file)
+    converter._remove_temp_file(tmp_path / "missing.evt.tmp")
+    converter._drain_cleanup_queue()
+
+    assert list(tmp_path.iterdir()) == []
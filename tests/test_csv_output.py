@@ -4,7 +4,9 @@ import csv
 from io import StringIO
 from pathlib import Path
 
-from evt_parser import CsvFormatter, parse_evt_file
+import pytest
+
+from evt_parser import CsvFormatter, iter_evt_records, parse_evt_file
 
 
 def test_csv_output_has_no_metadata_header_lines() -> None:
@@ -28,3 +30,45 @@ def test_csv_rows_match_valid_records_and_are_single_line_cells() -> None:
         for cell in row:
             assert "\n" not in cell
             assert "\r" not in cell
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", ""),
+        ("plain", "plain"),
+        ("a\r\nb\rc\nd", "a\\nb\\nc\\nd"),
+        ("col\tcol", "col\\tcol"),
+        ("\x00bell\x07\x1f", "\\x00bell\\x07\\x1f"),
+    ],
+)
+def test_sanitize_csv_cell_escapes_control_characters(
+    value: str, expected: str
+) -> None:
+    assert CsvFormatter._sanitize_csv_cell(value) == expected
+
+
+def test_csv_selected_columns_match_record_dicts() -> None:
+    result = parse_evt_file(Path("test_files/System.evt"))
+    columns = ["time_written", "event_id", "user_sid", "data", "not_a_field"]
+    csv_text = CsvFormatter(columns=columns, include_header=False).format(result)
+    rows = list(csv.reader(StringIO(csv_text)))
+
+    assert len(rows) == len(result.records)
+    for row, record in zip(rows, result.records):
+        expected = record.to_dict()
+        assert row == [
+            expected["time_written"] or "",
+            str(expected["event_id"]),
+            expected["user_sid"] or "",
+            expected["data"] or "",
+            "",
+        ]
+
+
+def test_csv_write_stream_accepts_record_iterator() -> None:
+    path = Path("test_files/System.evt")
+    formatter = CsvFormatter()
+    output = StringIO()
+    formatter.write_stream(output, iter_evt_records(path))
+    assert output.getvalue() == formatter.format(parse_evt_file(path))
@@ -0,0 +1,40 @@
+import pickle
+
+import pytest
+
+from evt_parser.exceptions import (
+    ConversionError,
+    CorruptedEvtError,
+    EvtConverterError,
+    EvtDirtyFlagError,
+    OutputFormatError,
+    PlatformNotSupportedError,
+    WevtutilNotFoundError,
+)
+
+
+@pytest.mark.parametrize(
+    "error, message",
+    [
+        (
+            PlatformNotSupportedError("Linux"),
+            "EVT to EVTX conversion is only supported on Windows. "
+            "Current platform: Linux",
+        ),
+        (WevtutilNotFoundError(), "wevtutil command not found."),
+        (EvtDirtyFlagError("a.evt"), "EVT file has DIRTY flag set"),
+        (
+            ConversionError("failed", return_code=5, stderr="denied"),
+            "failed | Return code: 5 | Error output: denied",
+        ),
+        (CorruptedEvtError("a.evt", "bad header"), "Corrupted EVT file: a.evt"),
+        (OutputFormatError("bad", format_name="xml"), "[xml] bad"),
+    ],
+)
+def test_exception_message_survives_pickling(
+    error: EvtConverterError, message: str
+) -> None:
+    restored = pickle.loads(pickle.dumps(error))
+    assert type(restored) is type(error)
+    assert str(restored) == str(error)
+    assert str(error).startswith(message)
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+from typing import Optional
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from evt_parser import CsvFormatter, Formatter, JsonFormatter, XmlFormatter
+from evt_parser import EventRecord, iter_evt_record_batches, parse_evt_file
+
+
+@pytest.mark.parametrize(
+    "formatter",
+    [
+        JsonFormatter(),
+        JsonFormatter(indent=0),
+        XmlFormatter(),
+        XmlFormatter(pretty=False),
+        CsvFormatter(),
+    ],
+    ids=["json", "json-compact", "xml", "xml-compact", "csv"],
+)
+@pytest.mark.parametrize("include_metadata", [True, False])
+def test_format_to_matches_format(formatter: Formatter, include_metadata: bool) -> None:
+    result = parse_evt_file(Path("test_files/System.evt"))
+    stream = io.StringIO()
+    formatter.format_to(result, stream, include_metadata=include_metadata)
+    assert stream.getvalue() == formatter.format(
+        result, include_metadata=include_metadata
+    )
+
+
+@pytest.mark.parametrize(
+    "formatter",
+    [
+        JsonFormatter(),
+        JsonFormatter(indent=0),
+        XmlFormatter(),
+        XmlFormatter(pretty=False),
+        CsvFormatter(),
+    ],
+    ids=["json", "json-compact", "xml", "xml-compact", "csv"],
+)
+@pytest.mark.parametrize("batch_size", [1, 7, 10_000, None])
+def test_write_batches_matches_format_records(
+    formatter: Formatter, batch_size: Optional[int]
+) -> None:
+    path = Path("test_files/System.evt")
+    records = parse_evt_file(path).records
+    batches = iter_evt_record_batches(path, batch_size) if batch_size else []
+    stream = io.StringIO()
+    formatter.write_batches(stream, batches)
+    expected = formatter.format_records(records if batch_size else [])
+    assert stream.getvalue() == expected
+
+
+@pytest.mark.parametrize(
+    "formatter",
+    [JsonFormatter(), XmlFormatter(), CsvFormatter()],
+    ids=["json", "xml", "csv"],
+)
+def test_write_to_path_matches_format(formatter: Formatter, tmp_path: Path) -> None:
+    result = parse_evt_file(Path("test_files/System.evt"))
+    output = tmp_path / "out"
+    formatter.write(result, output)
+    with output.open(encoding="utf-8", newline=formatter.newline) as fp:
+        assert fp.read() == formatter.format(result)
+
+
+@pytest.mark.parametrize("pretty", [True, False])
+def test_xml_escapes_event_text(pretty: bool) -> None:
+    record = EventRecord(
+        record_number=7,
+        time_generated=None,
+        time_written=None,
+        event_id=1,
+        event_type="error",
+        event_type_raw=1,
+        event_category=0,
+        source="",
+        computer_name="A&B <host>",
+        user_sid="S-1-5-18",
+        strings=["", "x > y & z"],
+        data=b"\x00\xff",
+        raw_record=b"",
+    )
+    root = ET.fromstring(XmlFormatter(pretty=pretty).format_records([record]))
+    event = root.find("Event")
+    assert event is not None and event.get("RecordNumber") == "7"
+    assert event.findtext("TimeGenerated") == ""
+    assert event.findtext("Source") == ""
+    assert event.findtext("ComputerName") == "A&B <host>"
+    assert event.findtext("UserSID") == "S-1-5-18"
+    assert [s.text or "" for s in event.iter("String")] == ["", "x > y & z"]
+    assert event.findtext("Data") == "00ff"
+
+
+def test_xml_indent_fallback_matches_stdlib(monkeypatch: pytest.MonkeyPatch) -> None:
+    result = parse_evt_file(Path("test_files/System.evt"))
+    expected = XmlFormatter().format(result)
+    monkeypatch.delattr(ET, "indent")
+    assert XmlFormatter().format(result) == expected
+
+
+@pytest.mark.parametrize("name", ["Application.evt", "Security.evt", "System.evt"])
+def test_json_orjson_output_matches_stdlib(name: str) -> None:
+    pytest.importorskip("orjson")
+    result = parse_evt_file(Path("test_files") / name)
+    stdlib = JsonFormatter()
+    stdlib._orjson_option = None
+    assert JsonFormatter().format(result) == stdlib.format(result)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import struct
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Sequence
+
+import pytest
+
+import evt_parser.parser as parser
+from evt_parser import iter_evt_record_batches, iter_evt_records, parse_evt_file
+
+
+def _utf16z(text: str) -> bytes:
+    return text.encode("utf-16-le") + b"\x00\x00"
+
+
+def _record(
+    record_number: int,
+    *,
+    event_id: int = 7036,
+    source: str = "Service Control Manager",
+    computer: str = "HOST",
+    strings: Sequence[str] = (),
+    data: bytes = b"",
+    timestamp: int = 1_100_000_000,
+) -> bytes:
+    variable = _utf16z(source) + _utf16z(computer)
+    string_offset = 56 + len(variable)
+    body = b"".join(_utf16z(s) for s in strings)
+    data_offset = string_offset + len(body)
+    size = data_offset + len(data) + 4
+    fixed = struct.pack(
+        "<I4sIIIIHHHHIIIIII",
+        size,
+        b"LfLe",
+        record_number,
+        timestamp,
+        timestamp + 1,
+        0x40000000 | event_id,
+        4,
+        len(strings),
+        2,
+        0,
+        record_number,
+        string_offset,
+        0,
+        0,
+        len(data),
+        data_offset if data else 0,
+    )
+    return fixed + variable + body + data + struct.pack("<I", size)
+
+
+def _evt_file(path: Path, records: List[bytes]) -> Path:
+    body = b"".join(records)
+    end_offset = 48 + len(body)
+    header = struct.pack(
+        "<I4sIIIIIIIIII",
+        48,
+        b"LfLe",
+        1,
+        1,
+        48,
+        end_offset,
+        len(records) + 1,
+        1,
+        0x10000,
+        0,
+        0,
+        48,
+    )
+    eof = struct.pack(
+        "<I16sIIIII",
+        40,
+        bytes.fromhex("11111111222222223333333344444444"),
+        48,
+        end_offset,
+        len(records) + 1,
+        1,
+        40,
+    )
+    path.write_bytes(header + body + eof)
+    return path
+
+
+def test_parse_evt_file_decodes_record_fields(tmp_path: Path) -> None:
+    path = _evt_file(
+        tmp_path / "log.evt",
+        [_record(1, strings=["running", "ok"], data=b"\x01\x02")],
+    )
+
+    result = parse_evt_file(path)
+
+    assert result.header.current_record_number == 2
+    assert result.header.end_offset == path.stat().st_size - 40
+    assert (result.total_records, result.valid_records) == (1, 1)
+    record = result.records[0]
+    assert record.record_number == 1
+    assert record.event_id == 7036
+    assert record.event_type == "information"
+    assert record.event_category == 2
+    assert record.source == "Service Control Manager"
+    assert record.computer_name == "HOST"
+    assert record.strings == ["running", "ok"]
+    assert record.data == b"\x01\x02"
+    assert record.time_generated == datetime.fromtimestamp(1_100_000_000, timezone.utc)
+
+
+def test_parse_and_iter_resynchronize_after_garbage(tmp_path: Path) -> None:
+    path = _evt_file(
+        tmp_path / "log.evt",
+        [_record(1), b"\xff" * 12, _record(2), b"\x00" * 6, _record(3)],
+    )
+
+    result = parse_evt_file(path)
+
+    assert [r.record_number for r in result.records] == [1, 2, 3]
+    assert result.parse_errors == 0
+    assert [r.record_number for r in iter_evt_records(path)] == [1, 2, 3]
+
+
+def test_parse_falls_back_to_reading_unmappable_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _evt_file(tmp_path / "log.evt", [_record(1), _record(2)])
+
+    def unmappable(*args: object, **kwargs: object) -> None:
+        raise OSError("mmap not supported")
+
+    monkeypatch.setattr(parser.mmap, "mmap", unmappable)
+
+    assert [r.record_number for r in parse_evt_file(path).records] == [1, 2]
+    assert [r.record_number for r in iter_evt_records(path)] == [1, 2]
+
+
+def test_parse_closes_the_map_when_madvise_fails(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _evt_file(tmp_path / "log.evt", [_record(1), _record(2)])
+    closed = []
+
+    class UnadvisableMap:
+        def __init__(self, *args: object, **kwargs: object) -> None:
+            pass
+
+        def madvise(self, *args: object) -> None:
+            raise OSError("madvise not supported")
+
+        def close(self) -> None:
+            closed.append(True)
+
+    monkeypatch.setattr(parser.mmap, "mmap", UnadvisableMap)
+    monkeypatch.setattr(parser.mmap, "MADV_SEQUENTIAL", 2, raising=False)
+
+    assert [r.record_number for r in parse_evt_file(path).records] == [1, 2]
+    assert closed == [True]
+
+
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (_utf16z("HOST") + b"rest", ("HOST", 10)),
+        # "A" then U+0100 has a 0x0000 pair across two code units
+        ("AĀB".encode("utf-16-le") + b"\x00\x00", ("AĀB", 8)),
+        ("abc".encode("utf-16-le"), ("abc", 8)),
+        (b"", ("", 2)),
+    ],
+)
+def test_read_null_terminated_utf16_stops_at_aligned_terminator(
+    data: bytes, expected: tuple[str, int]
+) -> None:
+    assert parser._read_null_terminated_utf16(data, 0) == expected
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        (
+            bytes([1, 5])
+            + (5).to_bytes(6, "big")
+            + struct.pack("<5I", 21, 1, 2, 3, 500),
+            "S-1-5-21-1-2-3-500",
+        ),
+        (bytes([1, 1]) + (5).to_bytes(6, "big") + struct.pack("<I", 18), "S-1-5-18"),
+        (bytes([1, 0]) + (1).to_bytes(6, "big"), "S-1-1-"),
+        (bytes([1, 2]) + (5).to_bytes(6, "big") + struct.pack("<I", 32), None),
+        (b"\x01", None),
+    ],
+)
+def test_parse_sid(data: bytes, expected: str | None) -> None:
+    assert parser._parse_sid(data) == expected
+
+
+def test_repeated_source_and_computer_names_share_one_string(
+    tmp_path: Path,
+) -> None:
+    path = _evt_file(
+        tmp_path / "log.evt",
+        [
+            _record(1, source="Svc", computer="HOST"),
+            _record(2, source="Svc", computer="HOST"),
+        ],
+    )
+
+    first, second = parse_evt_file(path).records
+    assert first.source is second.source
+    assert first.computer_name is second.computer_name
+
+
+def test_isoformat_cache_keeps_time_zones_apart() -> None:
+    utc = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    local = utc.astimezone(timezone(timedelta(hours=2)))
+
+    assert parser._isoformat(utc) == "2024-01-01T12:00:00+00:00"
+    assert parser._isoformat(local) == "2024-01-01T14:00:00+02:00"
+
+
+def test_raw_record_bytes_are_kept_only_on_request(tmp_path: Path) -> None:
+    raw = _record(1, strings=["x"])
+    path = _evt_file(tmp_path / "log.evt", [raw])
+
+    assert parse_evt_file(path).records[0].raw_record is None
+    assert parse_evt_file(path, keep_raw=True).records[0].raw_record == raw
+    assert next(iter_evt_records(path)).raw_record is None
+    assert next(iter_evt_records(path, keep_raw=True)).raw_record == raw
+
+
+def test_parallel_parse_matches_serial_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = _evt_file(
+        tmp_path / "log.evt",
+        [_record(i, strings=[f"s{i}"]) for i in range(1, 40)] + [b"\xff" * 8],
+    )
+    monkeypatch.setattr(parser, "PARALLEL_PARSE_MIN_RECORDS", 10)
+
+    serial = parse_evt_file(path)
+    parallel = parse_evt_file(path, workers=2)
+
+    assert parallel.records == serial.records
+    assert (parallel.total_records, parallel.errors) == (
+        serial.total_records,
+        serial.errors,
+    )
+
+
+def test_iter_evt_record_batches_splits_records(tmp_path: Path) -> None:
+    path = _evt_file(tmp_path / "log.evt", [_record(i) for i in range(1, 6)])
+
+    batches = list(iter_evt_record_batches(path, batch_size=2))
+
+    assert [[r.record_number for r in batch] for batch in batches] == [
+        [1, 2],
+        [3, 4],
+        [5],
+    ]
+    with pytest.raises(ValueError):
+        next(iter_evt_record_batches(path, batch_size=0))
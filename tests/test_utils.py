@@ -1,24 +1,40 @@
+import errno
+import os
 import platform
 import shutil
-from pathlib import Path
+import stat
+from pathlib import Path, PurePath, PurePosixPath, PureWindowsPath
+from typing import Iterator, Type
 
 import pytest
 
+import evt_parser.utils as utils
 from evt_parser.exceptions import (
     FileValidationError,
     PlatformNotSupportedError,
     WevtutilNotFoundError,
 )
 from evt_parser.utils import (
+    _reset_check_caches,
     check_platform,
     check_wevtutil_available,
     find_evt_files,
     generate_output_path,
+    is_evt_dirty,
+    repair_dirty_evt,
     validate_legacy_evt_signature,
     validate_evt_file,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_check_caches() -> Iterator[None]:
+    # Tests patch platform.system / shutil.which, so drop cached lookups
+    _reset_check_caches()
+    yield
+    _reset_check_caches()
+
+
 def test_check_platform_raises_on_non_windows(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(platform, "system", lambda: "Darwin")
     with pytest.raises(PlatformNotSupportedError):
@@ -47,6 +63,21 @@ def test_check_wevtutil_available_allows_when_found(
     check_wevtutil_available()
 
 
+def test_check_wevtutil_available_caches_successful_lookup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls = []
+
+    def fake_which(name: str) -> str:
+        calls.append(name)
+        return "C:\\Windows\\System32\\wevtutil.exe"
+
+    monkeypatch.setattr(shutil, "which", fake_which)
+    check_wevtutil_available()
+    check_wevtutil_available()
+    assert calls == ["wevtutil"]
+
+
 def test_validate_evt_file_rejects_missing_input(tmp_path: Path) -> None:
     with pytest.raises(FileValidationError):
         validate_evt_file(tmp_path / "missing.evt")
@@ -68,6 +99,18 @@ def test_validate_evt_file_rejects_missing_output_dir(tmp_path: Path) -> None:
         validate_evt_file(input_evt, out_dir / "out.evtx")
 
 
+def test_validate_evt_file_rejects_directory_paths(tmp_path: Path) -> None:
+    input_evt = tmp_path / "in.evt"
+    input_evt.write_bytes(b"\x00\x00\x00\x00LfLe")
+    (tmp_path / "dir.evt").mkdir()
+    (tmp_path / "out.evtx").mkdir()
+
+    with pytest.raises(FileValidationError, match="not a file"):
+        validate_evt_file(tmp_path / "dir.evt")
+    with pytest.raises(FileValidationError, match="is a directory"):
+        validate_evt_file(input_evt, tmp_path / "out.evtx")
+
+
 def test_validate_legacy_evt_signature_rejects_missing_signature(
     tmp_path: Path,
 ) -> None:
@@ -77,6 +120,168 @@ def test_validate_legacy_evt_signature_rejects_missing_signature(
         validate_legacy_evt_signature(p)
 
 
+@pytest.mark.parametrize("flags, dirty", [(0x0, False), (0x1, True), (0x3, True)])
+def test_is_evt_dirty_reads_flags_from_header(
+    tmp_path: Path, flags: int, dirty: bool
+) -> None:
+    header = bytearray(48)
+    header[4:8] = b"LfLe"
+    header[0x24:0x28] = flags.to_bytes(4, "little")
+    p = tmp_path / "log.evt"
+    p.write_bytes(bytes(header))
+    assert is_evt_dirty(p) is dirty
+
+
+def test_is_evt_dirty_rejects_truncated_header(tmp_path: Path) -> None:
+    p = tmp_path / "short.evt"
+    p.write_bytes(b"\x00\x00\x00\x00LfLe")
+    with pytest.raises(FileValidationError):
+        is_evt_dirty(p)
+
+
+def _eof_record(current: int, oldest: int) -> bytes:
+    return (
+        (40).to_bytes(4, "little")
+        + bytes.fromhex("11111111222222223333333344444444")
+        + (48).to_bytes(4, "little")
+        + (48).to_bytes(4, "little")
+        + current.to_bytes(4, "little")
+        + oldest.to_bytes(4, "little")
+        + (40).to_bytes(4, "little")
+    )
+
+
+def _dirty_header(flags: int) -> bytes:
+    header = bytearray(48)
+    header[4:8] = b"LfLe"
+    header[0x24:0x28] = flags.to_bytes(4, "little")
+    return bytes(header)
+
+
+@pytest.mark.parametrize(
+    "mappable, chunk_size", [(True, 1 << 20), (False, 1 << 20), (False, 7)]
+)
+def test_repair_dirty_evt_writes_fixed_copy_to_temp_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mappable: bool, chunk_size: int
+) -> None:
+    if not mappable:
+
+        def unmappable(*args: object, **kwargs: object) -> None:
+            raise OSError("mmap not supported")
+
+        monkeypatch.setattr(utils.mmap, "mmap", unmappable)
+    # A small chunk size makes the EOF signature straddle two reads
+    monkeypatch.setattr(utils, "_REPAIR_SCAN_CHUNK_SIZE", chunk_size)
+    header = _dirty_header(0x1 | 0x2)
+    eof_record = _eof_record(current=9, oldest=3)
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    temp_dir = tmp_path / "temp"
+    temp_dir.mkdir()
+    p = source_dir / "log.evt"
+    p.write_bytes(header + b"\x00" * 5 + eof_record)
+
+    repaired = repair_dirty_evt(p, temp_dir=temp_dir)
+
+    assert repaired.parent == temp_dir
+    assert list(source_dir.iterdir()) == [p]
+    data = repaired.read_bytes()
+    assert int.from_bytes(data[0x14:0x18], "little") == 48 + 5 + 40
+    assert int.from_bytes(data[0x18:0x1C], "little") == 9
+    assert int.from_bytes(data[0x1C:0x20], "little") == 3
+    assert int.from_bytes(data[0x24:0x28], "little") == 0x2
+    assert data[:0x14] == p.read_bytes()[:0x14]
+    assert data[0x20:0x24] == p.read_bytes()[0x20:0x24]
+    assert data[48:] == p.read_bytes()[48:]
+
+
+def test_repair_dirty_evt_reads_only_the_tail_of_an_unwrapped_log(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def full_scan(*args: object) -> int:
+        raise AssertionError("unexpected full scan")
+
+    monkeypatch.setattr(utils, "_find_in_file", full_scan)
+    p = tmp_path / "log.evt"
+    p.write_bytes(_dirty_header(0x1) + b"\x00" * 100 + _eof_record(7, 1))
+
+    data = repair_dirty_evt(p, tmp_path / "out.evt").read_bytes()
+
+    assert int.from_bytes(data[0x14:0x18], "little") == 48 + 100 + 40
+    assert int.from_bytes(data[0x18:0x1C], "little") == 7
+
+
+def test_repair_dirty_evt_scans_a_wrapped_log_from_the_start(tmp_path: Path) -> None:
+    # Stale EOF record bytes after the live one must not be picked up
+    p = tmp_path / "log.evt"
+    p.write_bytes(
+        _dirty_header(0x1 | 0x2) + _eof_record(7, 1) + b"\x00" * 8 + _eof_record(2, 1)
+    )
+
+    data = repair_dirty_evt(p, tmp_path / "out.evt").read_bytes()
+
+    assert int.from_bytes(data[0x14:0x18], "little") == 48 + 40
+    assert int.from_bytes(data[0x18:0x1C], "little") == 7
+
+
+def test_repair_dirty_evt_copy_keeps_source_timestamps_and_mode(
+    tmp_path: Path,
+) -> None:
+    p = tmp_path / "log.evt"
+    p.write_bytes(_dirty_header(0x1) + _eof_record(7, 1))
+    p.chmod(0o640)
+    os.utime(p, ns=(1_000_000_000, 2_000_000_000))
+
+    repaired = repair_dirty_evt(p, tmp_path / "out.evt")
+
+    assert repaired.stat().st_mtime_ns == 2_000_000_000
+    assert stat.S_IMODE(repaired.stat().st_mode) == stat.S_IMODE(p.stat().st_mode)
+
+
+def test_repair_dirty_evt_in_place_patches_the_input(tmp_path: Path) -> None:
+    p = tmp_path / "log.evt"
+    p.write_bytes(_dirty_header(0x1) + _eof_record(7, 1))
+
+    assert repair_dirty_evt(p, in_place=True) == p
+    assert list(tmp_path.iterdir()) == [p]
+    data = p.read_bytes()
+    assert int.from_bytes(data[0x18:0x1C], "little") == 7
+    assert int.from_bytes(data[0x24:0x28], "little") == 0
+
+    with pytest.raises(ValueError):
+        repair_dirty_evt(p, tmp_path / "out.evt", in_place=True)
+
+
+@pytest.mark.parametrize(
+    "copy_file_range, platform_name",
+    [("unsupported", "linux"), ("missing", "darwin"), ("missing", "win32")],
+)
+def test_copy_file_contents_falls_back_to_other_copies(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    copy_file_range: str,
+    platform_name: str,
+) -> None:
+    def unsupported(*args: object) -> int:
+        raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+    monkeypatch.setattr(utils.sys, "platform", platform_name)
+    if copy_file_range == "unsupported":
+        monkeypatch.setattr(utils.os, "copy_file_range", unsupported, raising=False)
+    else:
+        monkeypatch.delattr(utils.os, "copy_file_range", raising=False)
+    source = tmp_path / "log.evt"
+    source.write_bytes(bytes(range(256)) * 10)
+    target = tmp_path / "copy.evt"
+    target.write_bytes(b"stale contents that are longer than nothing")
+
+    utils._copy_file_contents(source, target)
+
+    assert target.read_bytes() == source.read_bytes()
+    with pytest.raises(shutil.SameFileError):
+        utils._copy_file_contents(source, source)
+
+
 def test_generate_output_path_default_dir(tmp_path: Path) -> None:
     input_evt = tmp_path / "System.evt"
     assert generate_output_path(input_evt) == tmp_path / "System.evtx"
@@ -89,22 +294,65 @@ def test_generate_output_path_custom_dir(tmp_path: Path) -> None:
 
 
 def test_find_evt_files_non_recursive(tmp_path: Path) -> None:
-    (tmp_path / "a.evt").write_bytes(b"a")
-    (tmp_path / "b.evt").write_bytes(b"b")
-    (tmp_path / "c.evtx").write_bytes(b"c")
+    (tmp_path / "a.evt").touch()
+    (tmp_path / "b.evt").touch()
+    (tmp_path / "c.evtx").touch()
     sub = tmp_path / "sub"
     sub.mkdir()
-    (sub / "d.evt").write_bytes(b"d")
+    (sub / "d.evt").touch()
 
     files = find_evt_files(tmp_path, recursive=False)
     assert [p.name for p in files] == ["a.evt", "b.evt"]
 
 
-def test_find_evt_files_recursive(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    "name", ["a.evt", "A.EVT", "a.Evt", "a.evtx", "a.evt.bak", ".evt", "evt", "a..evt"]
+)
+def test_has_evt_suffix_matches_path_suffix(name: str) -> None:
+    assert utils._has_evt_suffix(name) == (Path(name).suffix.lower() == ".evt")
+
+
+def test_find_evt_files_matches_suffix_case_insensitively(tmp_path: Path) -> None:
+    (tmp_path / "A.EVT").touch()
+    (tmp_path / "b.Evt").touch()
+    (tmp_path / "dir.evt").mkdir()
+
+    files = find_evt_files(tmp_path)
+    assert [p.name for p in files] == ["A.EVT", "b.Evt"]
+
+
+def test_find_evt_files_with_size_lists_sorted_paths_and_sizes(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "b.evt").write_bytes(b"bb")
     (tmp_path / "a.evt").write_bytes(b"a")
     sub = tmp_path / "sub"
     sub.mkdir()
-    (sub / "d.evt").write_bytes(b"d")
+    (sub / "c.evt").write_bytes(b"ccc")
+
+    assert utils.find_evt_files_with_size(tmp_path, recursive=True) == [
+        (tmp_path / "a.evt", 1),
+        (tmp_path / "b.evt", 2),
+        (sub / "c.evt", 3),
+    ]
+    with pytest.raises(FileValidationError):
+        utils.find_evt_files_with_size(tmp_path / "missing")
+
+
+@pytest.mark.parametrize("flavour", [PurePosixPath, PureWindowsPath])
+def test_path_sort_key_orders_like_paths(flavour: Type[PurePath]) -> None:
+    paths = [
+        flavour(p)
+        for p in ["/l/a-b.evt", "/l/a/b.evt", "/l/B.evt", "/l/a.evt", "/l/b/c.evt"]
+    ]
+    assert sorted(paths, key=utils._path_sort_key) == sorted(paths)
+
+
+def test_find_evt_files_recursive(tmp_path: Path) -> None:
+    (tmp_path / "a.evt").touch()
+    sub = tmp_path / "sub"
+    sub.mkdir()
+    (sub / "d.evt").touch()
 
     files = find_evt_files(tmp_path, recursive=True)
     assert [p.relative_to(tmp_path).as_posix() for p in files] == ["a.evt", "sub/d.evt"]